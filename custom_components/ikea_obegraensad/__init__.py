@@ -1,220 +1,479 @@
 """The IKEA OBEGRÄNSAD LED Control integration."""
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Awaitable, Callable
+from datetime import timedelta
 import json
 import logging
+import time
+from typing import Any
 
 import voluptuous as vol
 from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers import selector
+from homeassistant.helpers.service import async_extract_referenced_entity_ids
+from homeassistant.helpers.storage import Store
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_HOST, Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse
+from homeassistant.exceptions import HomeAssistantError
 
-from .const import DOMAIN
+from .const import (
+    CONF_MAX_COMMAND_RATE,
+    CONF_PING_INTERVAL,
+    CONF_PING_TIMEOUT,
+    CONF_STALE_AFTER,
+    DEFAULT_MAX_COMMAND_RATE,
+    DEFAULT_PING_INTERVAL,
+    DEFAULT_PING_TIMEOUT,
+    DEFAULT_STALE_AFTER,
+    DOMAIN,
+    MAX_PARALLEL_SERVICE_CALLS,
+    MESSAGE_REPEAT_FOREVER,
+    STORAGE_KEY,
+    STORAGE_VERSION,
+)
+from .animation import ANIMATIONS, build_animation
 from .coordinator import IkeaLedCoordinator
+from .frame import Frame
+from .graph import GraphFeed
+from .schedule import compile_schedule, parse_schedule
+from .snapshots import SnapshotStore
+from .text import FONTS, render_frames, text_source
+from .supervisor import async_get_supervisor
 
 _LOGGER = logging.getLogger(__name__)
 
-PLATFORMS: list[Platform] = [Platform.LIGHT, Platform.SELECT, Platform.SENSOR, Platform.BUTTON]
+PLATFORMS: list[Platform] = [
+    Platform.LIGHT,
+    Platform.SELECT,
+    Platform.SENSOR,
+    Platform.BUTTON,
+    Platform.IMAGE,
+]
 
 
 async def async_setup(hass: HomeAssistant, config: dict) -> bool:
     """Set up the integration and register module-level services.
 
     Services are registered at module level so they show up in the UI even
-    before an entry is configured. Handlers will pick the right coordinator
-    based on configured entries.
+    before an entry is configured. Handlers run against every panel picked by
+    the service target (or host), concurrently.
     """
 
-    def _get_coordinator(host: str | None = None) -> IkeaLedCoordinator | None:
-        data = hass.data.get(DOMAIN, {})
-        if host:
-            for entry_id, coord in data.items():
-                if isinstance(coord, IkeaLedCoordinator) and coord.host == host:
-                    return coord
-
-        # If only a single coordinator is configured, return it
-        coords = [c for c in data.values() if isinstance(c, IkeaLedCoordinator)]
-        if len(coords) == 1:
-            return coords[0]
-        return None
+    def _get_coordinators(call: ServiceCall) -> list[IkeaLedCoordinator]:
+        """Return the coordinators targeted by a service call.
 
-    async def persist_plugin_service(call) -> None:
-        host = call.data.get("host")
-        coord = _get_coordinator(host)
-        if not coord:
-            _LOGGER.error("No IKEA OBEGRÄNSAD coordinator found for persist_plugin")
-            return
-        await hass.async_add_executor_job(coord.persist_plugin)
-
-    async def set_schedule_service(call) -> None:
-        host = call.data.get("host")
-        schedule = call.data.get("schedule")
-        coord = _get_coordinator(host)
-        if not coord:
-            _LOGGER.error("No IKEA OBEGRÄNSAD coordinator found for set_schedule")
-            return
-        # Expect schedule as a JSON string in the UI for best frontend support.
-        # If callers provide structured data (dict/list), convert to JSON here.
-        if not isinstance(schedule, str):
-            schedule = json.dumps(schedule)
-        await coord.async_set_schedule(schedule)
-
-    async def clear_schedule_service(call) -> None:
-        host = call.data.get("host")
-        coord = _get_coordinator(host)
-        if not coord:
-            _LOGGER.error("No IKEA OBEGRÄNSAD coordinator found for clear_schedule")
-            return
-        await coord.async_clear_schedule()
+        Without a target the single configured panel is used, as before.
+        """
+        coords = {
+            entry_id: coord
+            for entry_id, coord in hass.data.get(DOMAIN, {}).items()
+            if isinstance(coord, IkeaLedCoordinator)
+        }
+        hosts = set(call.data.get("host") or ())
+        if not hosts and not any(call.data.get(str(key)) for key in cv.TARGET_SERVICE_FIELDS):
+            return list(coords.values()) if len(coords) == 1 else []
 
-    async def start_schedule_service(call) -> None:
-        host = call.data.get("host")
-        coord = _get_coordinator(host)
-        if not coord:
-            _LOGGER.error("No IKEA OBEGRÄNSAD coordinator found for start_schedule")
-            return
-        await coord.async_start_schedule()
+        # Devices, areas and entities are resolved the same way as for entity services
+        selected = async_extract_referenced_entity_ids(hass, call)
+        device_registry = dr.async_get(hass)
+        entity_registry = er.async_get(hass)
+        entry_ids: set[str] = set()
+        for device_id in selected.referenced_devices:
+            if (device := device_registry.async_get(device_id)) is not None:
+                entry_ids.update(device.config_entries)
+        for entity_id in selected.referenced | selected.indirectly_referenced:
+            if (entity := entity_registry.async_get(entity_id)) is not None and entity.config_entry_id:
+                entry_ids.add(entity.config_entry_id)
+        return [
+            coord
+            for entry_id, coord in coords.items()
+            if entry_id in entry_ids or coord.host in hosts
+        ]
 
-    async def stop_schedule_service(call) -> None:
-        host = call.data.get("host")
-        coord = _get_coordinator(host)
-        if not coord:
-            _LOGGER.error("No IKEA OBEGRÄNSAD coordinator found for stop_schedule")
-            return
-        await coord.async_stop_schedule()
+    async def _async_fan_out(
+        call: ServiceCall,
+        coords: list[IkeaLedCoordinator],
+        action: Callable[[IkeaLedCoordinator], Awaitable[Any]],
+    ) -> ServiceResponse:
+        """Run action against all panels, at most MAX_PARALLEL_SERVICE_CALLS at a time.
 
-    async def add_message_service(call) -> None:
-        host = call.data.get("host")
-        coord = _get_coordinator(host)
-        if not coord:
-            _LOGGER.error("No IKEA OBEGRÄNSAD coordinator found for add_message")
-            return
-        text = call.data.get("text")
-        repeat = call.data.get("repeat", 1)
-        mid = call.data.get("id", 0)
-        delay = call.data.get("delay", 50)
-        graph = call.data.get("graph")
-        miny = call.data.get("miny", 0)
-        maxy = call.data.get("maxy", 15)
-        # If graph is provided as string (JSON array or CSV), parse into list[int]
-        graph_list = None
-        if isinstance(graph, str):
-            # Try JSON first
+        One slow or failing panel does not hold up or abort the others. Returns
+        success and latency per host; a result of False counts as a failure and
+        a dict is added to the host's response.
+        """
+        semaphore = asyncio.Semaphore(MAX_PARALLEL_SERVICE_CALLS)
+
+        async def _async_run(coord: IkeaLedCoordinator) -> tuple[str, dict[str, Any]]:
+            async with semaphore:
+                start = time.monotonic()
+                result: dict[str, Any] = {}
+                try:
+                    value = await action(coord)
+                    result["success"] = value is not False
+                    if isinstance(value, dict):
+                        result.update(value)
+                except Exception as ex:  # pylint: disable=broad-except
+                    _LOGGER.error("%s failed on %s: %s", call.service, coord.host, ex)
+                    result["success"] = False
+                    result["error"] = str(ex)
+                result["latency_ms"] = round((time.monotonic() - start) * 1000, 1)
+            return coord.host, result
+
+        results = dict(await asyncio.gather(*(_async_run(coord) for coord in coords)))
+        for host, result in results.items():
+            if not result["success"]:
+                _LOGGER.debug("%s failed on %s", call.service, host)
+        return {"results": results}
+
+    def _fan_out_service(
+        action: Callable[[ServiceCall, IkeaLedCoordinator], Awaitable[Any]],
+    ) -> Callable[[ServiceCall], Awaitable[ServiceResponse]]:
+        """Wrap a per-panel handler into a service handler for all targets."""
+
+        async def _async_handle(call: ServiceCall) -> ServiceResponse:
+            coords = _get_coordinators(call)
+            if not coords:
+                _LOGGER.error("No IKEA OBEGRÄNSAD coordinator found for %s", call.service)
+                return {"results": {}}
+            return await _async_fan_out(call, coords, lambda coord: action(call, coord))
+
+        return _async_handle
+
+    async def persist_plugin_service(call: ServiceCall, coord: IkeaLedCoordinator) -> bool:
+        ack = await coord.async_persist_plugin()
+        return await coord.async_wait_for_ack(ack) is not None
+
+    async def set_schedule_service(call: ServiceCall, coord: IkeaLedCoordinator) -> dict[str, Any] | bool:
+        # Plugin names are resolved against each panel's own catalogue
+        entries = compile_schedule(call.data["schedule"], coord.plugin_index)
+        changed = not coord.schedule_matches(entries)
+        if not await coord.async_set_schedule(entries):
+            return False
+        response: dict[str, Any] = {"changed": changed}
+        if (transition := coord.next_schedule_transition(entries)) is not None:
+            entry, when = transition
+            response["next_plugin"] = entry.plugin_id
+            response["next_transition"] = when.isoformat()
+        return response
+
+    async def clear_schedule_service(call: ServiceCall, coord: IkeaLedCoordinator) -> bool:
+        return await coord.async_clear_schedule()
+
+    async def start_schedule_service(call: ServiceCall, coord: IkeaLedCoordinator) -> bool:
+        return await coord.async_start_schedule()
+
+    async def stop_schedule_service(call: ServiceCall, coord: IkeaLedCoordinator) -> bool:
+        return await coord.async_stop_schedule()
+
+    def _parse_graph(graph: Any) -> list[int] | None:
+        """Parse a graph given as a JSON array or comma-separated string."""
+        if not isinstance(graph, str):
+            return graph
+        # Try JSON first
+        try:
+            parsed = json.loads(graph)
+            if isinstance(parsed, list):
+                return [int(x) for x in parsed]
+        except Exception:
+            # Fallback: parse comma-separated integers
             try:
-                parsed = json.loads(graph)
-                if isinstance(parsed, list):
-                    graph_list = [int(x) for x in parsed]
+                parts = [p.strip() for p in graph.split(",") if p.strip()]
+                return [int(p) for p in parts]
             except Exception:
-                # Fallback: parse comma-separated integers
-                try:
-                    parts = [p.strip() for p in graph.split(",") if p.strip()]
-                    graph_list = [int(p) for p in parts]
-                except Exception:
-                    graph_list = None
-        else:
-            graph_list = graph
+                return None
+        return None
 
-        await coord.async_add_message(text, repeat, mid, delay, graph_list, miny, maxy)
+    async def add_message_service(call: ServiceCall, coord: IkeaLedCoordinator) -> dict[str, Any] | bool:
+        ttl = call.data.get("ttl")
+        mid = await coord.async_add_message(
+            call.data.get("text"),
+            int(call.data.get("repeat", 1)),
+            int(call.data.get("id", 0)),
+            int(call.data.get("delay", 50)),
+            _parse_graph(call.data.get("graph")),
+            int(call.data.get("miny", 0)),
+            int(call.data.get("maxy", 15)),
+            float(ttl) if ttl else None,
+        )
+        return False if mid is None else {"id": mid}
 
-    async def remove_message_service(call) -> None:
-        host = call.data.get("host")
-        coord = _get_coordinator(host)
-        if not coord:
-            _LOGGER.error("No IKEA OBEGRÄNSAD coordinator found for remove_message")
-            return
-        mid = call.data.get("id")
-        await coord.async_remove_message(mid)
-
-    async def clear_storage_service(call) -> None:
-        host = call.data.get("host")
-        coord = _get_coordinator(host)
-        if not coord:
-            _LOGGER.error("No IKEA OBEGRÄNSAD coordinator found for clear_storage")
+    async def remove_message_service(call: ServiceCall, coord: IkeaLedCoordinator) -> bool:
+        return await coord.async_remove_message(call.data.get("id"))
+
+    async def clear_storage_service(call: ServiceCall, coord: IkeaLedCoordinator) -> bool:
+        return await coord.async_clear_storage()
+
+    async def push_frame_service(call: ServiceCall, coord: IkeaLedCoordinator) -> None:
+        # Parsed once by the schema and shared by all panels
+        changed = await coord.async_push_frame(call.data["frame"], call.data.get("force", False))
+        _LOGGER.debug("Pushed frame to %s, %s pixels changed", coord.host, changed)
+
+    async def start_animation_service(call: ServiceCall, coord: IkeaLedCoordinator) -> None:
+        _ensure_connected(coord)
+        duration = call.data.get("duration")
+        source, duration = build_animation(call.data["animation"], float(duration) if duration else None)
+        coord.async_start_animation(source, float(call.data.get("fps", 10)), duration)
+
+    async def stop_animation_service(call: ServiceCall, coord: IkeaLedCoordinator) -> None:
+        coord.async_stop_animation()
+
+    async def show_text_service(call: ServiceCall, coord: IkeaLedCoordinator) -> None:
+        _ensure_connected(coord)
+        text = call.data["text"]
+        font = call.data.get("font", "small")
+        frames = render_frames(text, font)
+        if len(frames) == 1:
+            await coord.async_push_frame(frames[0])
             return
-        await coord.async_clear_storage()
+        repeat = int(call.data.get("repeat", 1))
+        coord.async_start_animation(text_source(text, font, repeat), float(call.data.get("speed", 12)))
+
+    async def bind_graph_service(call: ServiceCall, coord: IkeaLedCoordinator) -> None:
+        feed = GraphFeed(
+            hass,
+            coord,
+            call.data["entity_id"],
+            timedelta(hours=float(call.data.get("hours", 24))),
+            int(call.data.get("id", 1)),
+            call.data.get("text", ""),
+            float(call.data.get("interval", 10)),
+        )
+        await coord.async_bind_graph(feed)
+
+    async def unbind_graph_service(call: ServiceCall, coord: IkeaLedCoordinator) -> None:
+        feed = coord.graph_feed
+        coord.async_unbind_graph()
+        if feed is not None:
+            await coord.async_remove_message(feed.message_id)
 
-    async def get_data_service(call) -> None:
-        host = call.data.get("host")
-        coord = _get_coordinator(host)
-        if not coord:
+    snapshots = SnapshotStore(hass, hass.config.path(DOMAIN))
+
+    async def get_data_service(call: ServiceCall) -> ServiceResponse:
+        if call.data.get("all"):
+            coords = [c for c in hass.data.get(DOMAIN, {}).values() if isinstance(c, IkeaLedCoordinator)]
+        else:
+            coords = _get_coordinators(call)
+        if not coords:
             _LOGGER.error("No IKEA OBEGRÄNSAD coordinator found for get_data")
-            return
-        data = await coord.async_get_data()
+            return {"results": {}}
+        data: dict[str, bytes] = {}
+
+        async def _async_fetch(coord: IkeaLedCoordinator) -> bool:
+            if not (result := await coord.async_get_data()):
+                _LOGGER.error("Failed to fetch data from device %s", coord.host)
+                return False
+            data[coord.host] = result
+            return True
+
+        response = await _async_fan_out(call, coords, _async_fetch)
         if not data:
-            _LOGGER.error("Failed to fetch data from device")
-            return
+            return response
+        # All snapshots are written in a single executor job
         try:
-            hass_config = hass.config.path()
-            outpath = f"{hass_config}/ikea_obegraensad_data.bin"
-            with open(outpath, "wb") as f:
-                f.write(data)
-            _LOGGER.info("Saved device data to %s", outpath)
-        except Exception as ex:
+            paths = await snapshots.async_save(data)
+            _LOGGER.info("Saved device data to %s", ", ".join(paths))
+        except OSError as ex:
             _LOGGER.error("Failed to save device data: %s", ex)
+            return response
+        response["paths"] = paths
+        return response
 
-    # Service schemas (use selector objects for better UI rendering)
-    persist_schema = vol.Schema({vol.Optional("host"): selector.TextSelector({})})
+    # Service schemas (use selector objects for better UI rendering). Every
+    # service can target several panels by host, device or area.
+    target_fields = {
+        **cv.TARGET_SERVICE_FIELDS,
+        # Panels can also be picked by address from YAML
+        vol.Optional("host"): vol.All(cv.ensure_list, [cv.string]),
+    }
+    persist_schema = vol.Schema(target_fields)
     set_schedule_schema = vol.Schema(
         {
-            vol.Optional("host"): selector.TextSelector({}),
-            vol.Required("schedule"): selector.TextSelector({"multiline": True}),
+            **target_fields,
+            # A JSON string from the UI, or a list when called from YAML
+            vol.Required("schedule"): vol.All(
+                vol.Any(selector.TextSelector({"multiline": True}), list), _valid_schedule
+            ),
         }
     )
-    simple_host_schema = vol.Schema({vol.Optional("host"): selector.TextSelector({})})
+    simple_host_schema = vol.Schema(target_fields)
     add_message_schema = vol.Schema(
         {
-            vol.Optional("host"): selector.TextSelector({}),
+            **target_fields,
             vol.Required("text"): selector.TextSelector({"multiline": True}),
-            vol.Optional("repeat", default=1): selector.NumberSelector({"min": 1, "max": 1000}),
+            vol.Optional("repeat", default=1): selector.NumberSelector(
+                {"min": MESSAGE_REPEAT_FOREVER, "max": 1000}
+            ),
             vol.Optional("id", default=0): selector.NumberSelector({"min": 0, "max": 65535}),
             vol.Optional("delay", default=50): selector.NumberSelector({"min": 0, "max": 10000}),
             vol.Optional("graph"): selector.TextSelector({}),
             vol.Optional("miny", default=0): selector.NumberSelector({"min": -32768, "max": 32767}),
             vol.Optional("maxy", default=15): selector.NumberSelector({"min": -32768, "max": 32767}),
+            vol.Optional("ttl"): selector.NumberSelector({"min": 1, "max": 604800}),
+        }
+    )
+    get_data_schema = vol.Schema(
+        {
+            **target_fields,
+            vol.Optional("all", default=False): selector.BooleanSelector({}),
+        }
+    )
+    push_frame_schema = vol.Schema(
+        {
+            **target_fields,
+            vol.Required("frame"): vol.All(selector.TextSelector({"multiline": True}), _valid_frame),
+            vol.Optional("force", default=False): selector.BooleanSelector({}),
+        }
+    )
+    start_animation_schema = vol.Schema(
+        {
+            **target_fields,
+            vol.Required("animation"): selector.SelectSelector({"options": list(ANIMATIONS)}),
+            vol.Optional("fps", default=10): selector.NumberSelector({"min": 1, "max": 60}),
+            vol.Optional("duration"): selector.NumberSelector({"min": 1, "max": 86400}),
+        }
+    )
+    show_text_schema = vol.Schema(
+        {
+            **target_fields,
+            vol.Required("text"): selector.TextSelector({}),
+            vol.Optional("font", default="small"): selector.SelectSelector({"options": list(FONTS)}),
+            vol.Optional("speed", default=12): selector.NumberSelector({"min": 1, "max": 60}),
+            vol.Optional("repeat", default=1): selector.NumberSelector({"min": 1, "max": 1000}),
+        }
+    )
+    bind_graph_schema = vol.Schema(
+        {
+            **target_fields,
+            vol.Required("entity_id"): selector.EntitySelector({"domain": "sensor"}),
+            vol.Optional("hours", default=24): selector.NumberSelector({"min": 0.1, "max": 720, "step": 0.1}),
+            vol.Optional("id", default=1): selector.NumberSelector({"min": 0, "max": 65535}),
+            vol.Optional("text", default=""): selector.TextSelector({}),
+            vol.Optional("interval", default=10): selector.NumberSelector({"min": 1, "max": 3600}),
         }
     )
     remove_message_schema = vol.Schema(
-        {vol.Optional("host"): selector.TextSelector({}), vol.Required("id"): selector.NumberSelector({"min": 0, "max": 65535})}
+        {
+            **target_fields,
+            # Number selectors return floats; the firmware matches the id as text
+            vol.Required("id"): vol.All(
+                selector.NumberSelector({"min": 0, "max": 65535}), vol.Coerce(int)
+            ),
+        }
     )
 
-    hass.services.async_register(DOMAIN, "persist_plugin", persist_plugin_service, schema=persist_schema)
-    hass.services.async_register(DOMAIN, "set_schedule", set_schedule_service, schema=set_schedule_schema)
-    hass.services.async_register(DOMAIN, "clear_schedule", clear_schedule_service, schema=simple_host_schema)
-    hass.services.async_register(DOMAIN, "start_schedule", start_schedule_service, schema=simple_host_schema)
-    hass.services.async_register(DOMAIN, "stop_schedule", stop_schedule_service, schema=simple_host_schema)
-    hass.services.async_register(DOMAIN, "add_message", add_message_service, schema=add_message_schema)
-    hass.services.async_register(DOMAIN, "remove_message", remove_message_service, schema=remove_message_schema)
-    hass.services.async_register(DOMAIN, "clear_storage", clear_storage_service, schema=simple_host_schema)
-    hass.services.async_register(DOMAIN, "get_data", get_data_service, schema=simple_host_schema)
+    services = {
+        "persist_plugin": (persist_plugin_service, persist_schema),
+        "set_schedule": (set_schedule_service, set_schedule_schema),
+        "clear_schedule": (clear_schedule_service, simple_host_schema),
+        "start_schedule": (start_schedule_service, simple_host_schema),
+        "stop_schedule": (stop_schedule_service, simple_host_schema),
+        "add_message": (add_message_service, add_message_schema),
+        "remove_message": (remove_message_service, remove_message_schema),
+        "clear_storage": (clear_storage_service, simple_host_schema),
+        "push_frame": (push_frame_service, push_frame_schema),
+        "bind_graph": (bind_graph_service, bind_graph_schema),
+        "unbind_graph": (unbind_graph_service, simple_host_schema),
+        "show_text": (show_text_service, show_text_schema),
+        "start_animation": (start_animation_service, start_animation_schema),
+        "stop_animation": (stop_animation_service, simple_host_schema),
+    }
+    for name, (action, schema) in services.items():
+        hass.services.async_register(
+            DOMAIN,
+            name,
+            _fan_out_service(action),
+            schema=schema,
+            supports_response=SupportsResponse.OPTIONAL,
+        )
+    hass.services.async_register(
+        DOMAIN,
+        "get_data",
+        get_data_service,
+        schema=get_data_schema,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
 
     return True
 
 
+def _valid_schedule(value: Any) -> Any:
+    """Validate the structure of a schedule before it is sent to any panel."""
+    try:
+        # Plugin names are resolved per panel in the service handler
+        parse_schedule(value)
+    except ValueError as ex:
+        raise vol.Invalid(str(ex)) from ex
+    return value
+
+
+def _valid_frame(value: Any) -> Frame:
+    """Parse frame data once, before it is sent to any panel."""
+    try:
+        return Frame.parse(value)
+    except ValueError as ex:
+        raise vol.Invalid(f"Invalid frame data: {ex}") from ex
+
+
+def _ensure_connected(coord: IkeaLedCoordinator) -> None:
+    """Fail the call up front; a running animation cannot report errors."""
+    if not coord.ws_connected:
+        raise HomeAssistantError(f"IKEA OBEGRÄNSAD LED at {coord.host} is not connected")
+
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up from a config entry (per device)."""
     host = entry.data[CONF_HOST]
-    coordinator = IkeaLedCoordinator(hass, host)
+    supervisor = async_get_supervisor(hass)
+    coordinator = IkeaLedCoordinator(
+        hass,
+        host,
+        max_command_rate=entry.options.get(CONF_MAX_COMMAND_RATE, DEFAULT_MAX_COMMAND_RATE),
+        ping_interval=entry.options.get(CONF_PING_INTERVAL, DEFAULT_PING_INTERVAL),
+        ping_timeout=entry.options.get(CONF_PING_TIMEOUT, DEFAULT_PING_TIMEOUT),
+        stale_after=entry.options.get(CONF_STALE_AFTER, DEFAULT_STALE_AFTER),
+        supervisor=supervisor,
+        entry_id=entry.entry_id,
+    )
+    await coordinator.async_restore_state()
+    supervisor.async_add(entry.entry_id, coordinator)
 
     try:
         await coordinator.async_config_entry_first_refresh()
     except Exception:
         _LOGGER.exception("Error setting up IKEA OBEGRÄNSAD LED device")
+        await supervisor.async_remove(entry.entry_id)
+        await coordinator.async_shutdown()
         raise
 
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][entry.entry_id] = coordinator
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    entry.async_on_unload(entry.add_update_listener(_async_update_listener))
 
     return True
 
 
+async def _async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Reload the entry when its options change."""
+    await hass.config_entries.async_reload(entry.entry_id)
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
         coordinator = hass.data[DOMAIN][entry.entry_id]
+        await async_get_supervisor(hass).async_remove(entry.entry_id)
         await coordinator.async_shutdown()
         hass.data[DOMAIN].pop(entry.entry_id)
     return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Delete the saved state of a removed entry."""
+    await Store(hass, STORAGE_VERSION, f"{STORAGE_KEY}.{entry.entry_id}").async_remove()
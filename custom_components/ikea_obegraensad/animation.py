@@ -0,0 +1,199 @@
+"""Client-side animations for IKEA OBEGRÄNSAD LED Control."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+import logging
+import math
+import random
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import DOMAIN
+from .frame import HEIGHT, PIXELS, WIDTH, Frame
+
+if TYPE_CHECKING:
+    from .coordinator import IkeaLedCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+# Produces the frame for (frame index, seconds since start); None ends the animation
+FrameSource = Callable[[int, float], "Frame | None"]
+
+
+class AnimationRunner:
+    """Generate frames at a target rate and push them to one panel.
+
+    Frame times are derived from the start time and frame index rather than
+    by accumulating sleeps, so the schedule does not drift. Frames whose time
+    has already passed are skipped, and frames are also dropped while the
+    previous one is still waiting to be sent, so a slow panel shows the most
+    recent frame instead of falling behind.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        coordinator: IkeaLedCoordinator,
+        source: FrameSource,
+        fps: float,
+        duration: float | None = None,
+    ) -> None:
+        """Initialize the runner."""
+        self.hass = hass
+        self._coordinator = coordinator
+        self._source = source
+        self.fps = fps
+        self._duration = duration
+        self._task: asyncio.Task | None = None
+        self._started: float | None = None
+        self._finished: float | None = None
+        self.frames_sent = 0
+        self.frames_dropped = 0
+
+    @property
+    def running(self) -> bool:
+        """Return True while the animation is running."""
+        return self._task is not None and not self._task.done()
+
+    @property
+    def achieved_fps(self) -> float:
+        """Return the rate at which frames actually reached the send queue."""
+        if self._started is None:
+            return 0.0
+        end = self._finished if self._finished is not None else self.hass.loop.time()
+        elapsed = end - self._started
+        return self.frames_sent / elapsed if elapsed > 0 else 0.0
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Return frame statistics for this animation."""
+        return {
+            "running": self.running,
+            "target_fps": self.fps,
+            "achieved_fps": round(self.achieved_fps, 2),
+            "frames_sent": self.frames_sent,
+            "frames_dropped": self.frames_dropped,
+        }
+
+    @callback
+    def async_start(self) -> None:
+        """Start the animation on the Home Assistant loop."""
+        self._task = self.hass.async_create_background_task(
+            self._async_run(), f"{DOMAIN} animation {self._coordinator.host}"
+        )
+
+    @callback
+    def async_cancel(self) -> None:
+        """Stop the animation."""
+        if self._task is not None:
+            self._task.cancel()
+
+    async def _async_run(self) -> None:
+        """Frame loop."""
+        loop = self.hass.loop
+        interval = 1 / self.fps
+        self._started = start = loop.time()
+        index = 0
+        try:
+            while True:
+                elapsed = loop.time() - start
+                if self._duration is not None and elapsed >= self._duration:
+                    # Always land on the final frame
+                    frame = self._source(index, self._duration)
+                    if frame is not None:
+                        await self._coordinator.async_push_animation_frame(frame)
+                        self.frames_sent += 1
+                    break
+                # Skip frames whose slot has already passed
+                due = int(elapsed * self.fps)
+                if due > index:
+                    self.frames_dropped += due - index
+                    index = due
+                if self._coordinator.frame_pending:
+                    # The panel has not taken the previous frame yet
+                    self.frames_dropped += 1
+                else:
+                    frame = self._source(index, index * interval)
+                    if frame is None:
+                        break
+                    await self._coordinator.async_push_animation_frame(frame)
+                    self.frames_sent += 1
+                index += 1
+                await asyncio.sleep(max(0.0, start + index * interval - loop.time()))
+        except ConnectionError:
+            _LOGGER.debug("Animation on %s stopped: not connected", self._coordinator.host)
+        finally:
+            self._finished = loop.time()
+            _LOGGER.debug(
+                "Animation on %s ended: %.1f/%s fps, %s frames sent, %s dropped",
+                self._coordinator.host,
+                self.achieved_fps,
+                self.fps,
+                self.frames_sent,
+                self.frames_dropped,
+            )
+
+
+def _fill(count: int) -> Frame:
+    """Return a frame with the first count pixels lit, row by row."""
+    count = max(0, min(PIXELS, count))
+    return Frame(b"\x01" * count + b"\x00" * (PIXELS - count))
+
+
+def progress_source(duration: float) -> FrameSource:
+    """Fill the panel pixel by pixel over duration seconds."""
+
+    def source(index: int, elapsed: float) -> Frame | None:
+        return _fill(math.ceil(PIXELS * min(1.0, elapsed / duration)))
+
+    return source
+
+
+def countdown_source(duration: float) -> FrameSource:
+    """Drain a full panel pixel by pixel over duration seconds."""
+
+    def source(index: int, elapsed: float) -> Frame | None:
+        return _fill(math.ceil(PIXELS * max(0.0, 1 - elapsed / duration)))
+
+    return source
+
+
+def equalizer_source(seed: int | None = None) -> FrameSource:
+    """Animate sixteen bouncing bars with peak decay."""
+    rng = random.Random(seed)
+    levels = [0.0] * WIDTH
+
+    def source(index: int, elapsed: float) -> Frame | None:
+        pixels = bytearray(PIXELS)
+        for x in range(WIDTH):
+            # Jump up to a new random level, otherwise fall back gradually
+            levels[x] = max(levels[x] * 0.8, rng.random() ** 2 * HEIGHT)
+            height = int(levels[x])
+            for y in range(HEIGHT - height, HEIGHT):
+                pixels[y * WIDTH + x] = 1
+        return Frame(pixels)
+
+    return source
+
+
+ANIMATIONS = ("progress", "countdown", "equalizer")
+# Seconds a progress or countdown animation runs when no duration is given
+DEFAULT_ANIMATION_DURATION = 10
+
+
+def build_animation(name: str, duration: float | None) -> tuple[FrameSource, float | None]:
+    """Return the frame source and run time of a built-in animation.
+
+    Progress and countdown run for a fixed time; the equalizer runs until it
+    is stopped unless a duration is given.
+    """
+    if name == "equalizer":
+        return equalizer_source(), duration
+    duration = duration or DEFAULT_ANIMATION_DURATION
+    if name == "progress":
+        return progress_source(duration), duration
+    if name == "countdown":
+        return countdown_source(duration), duration
+    raise ValueError(f"Unknown animation: {name}")
@@ -0,0 +1,138 @@
+"""HTTP client for the IKEA OBEGRÄNSAD firmware REST API."""
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import time
+from typing import Any
+
+import aiohttp
+
+from .const import (
+    HTTP_CONNECT_TIMEOUT,
+    HTTP_CONNECTIONS_PER_HOST,
+    HTTP_KEEPALIVE_TIMEOUT,
+    HTTP_REQUEST_TIMEOUT,
+    HTTP_RETRIES,
+    HTTP_RETRY_BACKOFF,
+    HTTP_SLOW_REQUEST,
+)
+from .metrics import RequestStats
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class IkeaLedApiError(Exception):
+    """Raised when a request to the panel fails."""
+
+
+class IkeaLedApiClient:
+    """Talk to the REST API of one panel over a small keep-alive pool.
+
+    The ESP32 web server only handles a few sockets at once, so requests to a
+    panel share at most HTTP_CONNECTIONS_PER_HOST connections that are kept
+    open between calls instead of paying a TCP handshake every time. When no
+    session is passed the client owns one and must be closed with async_close.
+    Idempotent requests are retried with exponential backoff on connection
+    errors and timeouts; every request is timed per endpoint.
+    """
+
+    def __init__(self, host: str, session: aiohttp.ClientSession | None = None) -> None:
+        """Initialize the client."""
+        self.host = host
+        self.base_url = f"http://{host}/api"
+        self._session = session
+        self._owns_session = session is None
+        # Per endpoint and across all endpoints
+        self.stats: dict[str, RequestStats] = {}
+        self.totals = RequestStats()
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Return the session, creating the pooled one on first use."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit_per_host=HTTP_CONNECTIONS_PER_HOST,
+                    keepalive_timeout=HTTP_KEEPALIVE_TIMEOUT,
+                ),
+                timeout=aiohttp.ClientTimeout(
+                    total=HTTP_REQUEST_TIMEOUT, connect=HTTP_CONNECT_TIMEOUT
+                ),
+            )
+        return self._session
+
+    async def async_close(self) -> None:
+        """Close the pooled session if this client owns it."""
+        if self._owns_session and self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def async_request(
+        self,
+        method: str,
+        path: str,
+        *,
+        params: dict[str, str] | None = None,
+        data: dict[str, str] | None = None,
+        idempotent: bool = True,
+        timeout: float = HTTP_REQUEST_TIMEOUT,
+    ) -> bytes:
+        """Send a request and return the response body.
+
+        Raises IkeaLedApiError when the panel cannot be reached or does not
+        answer with HTTP 200.
+        """
+        url = f"{self.base_url}/{path}"
+        stats = self.stats.setdefault(path, RequestStats())
+        totals = self.totals
+        retries = HTTP_RETRIES if idempotent else 0
+        attempt = 0
+        while True:
+            start = time.monotonic()
+            try:
+                async with self._get_session().request(
+                    method,
+                    url,
+                    params=params,
+                    data=data,
+                    timeout=aiohttp.ClientTimeout(total=timeout, connect=HTTP_CONNECT_TIMEOUT),
+                ) as resp:
+                    body = await resp.read()
+                    status = resp.status
+            except (aiohttp.ClientError, asyncio.TimeoutError) as ex:
+                stats.errors += 1
+                totals.errors += 1
+                if attempt >= retries:
+                    raise IkeaLedApiError(f"{method} {url} failed: {ex!r}") from ex
+                stats.retries += 1
+                totals.retries += 1
+                _LOGGER.debug("%s %s failed (%r), retrying", method, url, ex)
+                await asyncio.sleep(HTTP_RETRY_BACKOFF * 2**attempt)
+                attempt += 1
+                continue
+
+            duration = time.monotonic() - start
+            stats.latency.record(duration)
+            totals.latency.record(duration)
+            if duration > HTTP_SLOW_REQUEST:
+                _LOGGER.debug("%s %s took %.0f ms", method, url, duration * 1000)
+            if status != 200:
+                stats.errors += 1
+                totals.errors += 1
+                raise IkeaLedApiError(f"{method} {url} returned HTTP {status}")
+            return body
+
+    async def async_get_info(
+        self, *, retry: bool = True, timeout: float = HTTP_REQUEST_TIMEOUT
+    ) -> dict[str, Any]:
+        """Return the device state from `GET /api/info`."""
+        body = await self.async_request("GET", "info", idempotent=retry, timeout=timeout)
+        try:
+            return json.loads(body)
+        except ValueError as ex:
+            raise IkeaLedApiError(f"Invalid JSON from {self.host}: {ex}") from ex
+
+    async def async_get_data(self) -> bytes:
+        """Return the raw render buffer from `GET /api/data`."""
+        return await self.async_request("GET", "data", timeout=15)
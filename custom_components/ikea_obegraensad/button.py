@@ -47,7 +47,8 @@ class IkeaLedBaseButton(CoordinatorEntity[IkeaLedCoordinator], ButtonEntity):
         icon: str | None = None,
     ) -> None:
         """Initialize the button."""
-        super().__init__(coordinator)
+        # Buttons render no device state, so field changes never update them
+        super().__init__(coordinator, context=frozenset())
         self._entry = entry
         self._button_type = button_type
         self._attr_unique_id = f"{entry.entry_id}_{button_type}"
@@ -83,11 +84,8 @@ class IkeaLedRotateLeftButton(IkeaLedBaseButton):
     async def async_press(self) -> None:
         """Handle the button press."""
         try:
-            await self.hass.async_add_executor_job(
-                self.coordinator.set_rotation, "left"
-            )
-            # Gentle refresh to ensure UI updates
-            await self.coordinator.async_refresh_after_command()
+            ack = await self.coordinator.async_set_rotation("left")
+            await self.coordinator.async_wait_for_ack(ack)
         except Exception as ex:
             _LOGGER.error("Failed to rotate left: %s", ex)
 
@@ -108,11 +106,8 @@ class IkeaLedRotateRightButton(IkeaLedBaseButton):
     async def async_press(self) -> None:
         """Handle the button press."""
         try:
-            await self.hass.async_add_executor_job(
-                self.coordinator.set_rotation, "right"
-            )
-            # Gentle refresh to ensure UI updates
-            await self.coordinator.async_refresh_after_command()
+            ack = await self.coordinator.async_set_rotation("right")
+            await self.coordinator.async_wait_for_ack(ack)
         except Exception as ex:
             _LOGGER.error("Failed to rotate right: %s", ex)
 
@@ -131,10 +126,7 @@ class IkeaLedPersistPluginButton(IkeaLedBaseButton):
 
     async def async_press(self) -> None:
         try:
-            await self.hass.async_add_executor_job(
-                self.coordinator.persist_plugin
-            )
-            # Gentle refresh
-            await self.coordinator.async_refresh_after_command()
+            ack = await self.coordinator.async_persist_plugin()
+            await self.coordinator.async_wait_for_ack(ack)
         except Exception as ex:
             _LOGGER.error("Failed to persist plugin: %s", ex)
\ No newline at end of file
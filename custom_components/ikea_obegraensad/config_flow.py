@@ -1,18 +1,30 @@
 """Config flow for IKEA OBEGRÄNSAD LED Control integration."""
 from __future__ import annotations
 
-import asyncio
 import logging
 from typing import Any
 import voluptuous as vol
 
 from homeassistant import config_entries
 from homeassistant.const import CONF_HOST
-from homeassistant.core import HomeAssistant
+from homeassistant.core import callback
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.exceptions import HomeAssistantError
-
-from .const import DOMAIN
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+
+from .api import IkeaLedApiClient, IkeaLedApiError
+from .const import (
+    CONF_MAX_COMMAND_RATE,
+    CONF_PING_INTERVAL,
+    CONF_PING_TIMEOUT,
+    CONF_STALE_AFTER,
+    DEFAULT_MAX_COMMAND_RATE,
+    DEFAULT_PING_INTERVAL,
+    DEFAULT_PING_TIMEOUT,
+    DEFAULT_STALE_AFTER,
+    DOMAIN,
+    HTTP_PROBE_TIMEOUT,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -28,6 +40,14 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     VERSION = 1
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: config_entries.ConfigEntry,
+    ) -> OptionsFlowHandler:
+        """Get the options flow for this handler."""
+        return OptionsFlowHandler(config_entry)
+
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
@@ -62,49 +82,75 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     async def _test_connection(self, host: str) -> bool:
         """Test if we can connect to the device."""
-        import aiohttp
-        import async_timeout
-
+        # Reuse Home Assistant's shared session instead of opening one per attempt
+        client = IkeaLedApiClient(host, async_get_clientsession(self.hass))
         try:
-            url = f"http://{host}/api/info"
-
-            async with aiohttp.ClientSession() as session:
-                async with async_timeout.timeout(5):
-                    async with session.get(url) as response:
-                        if response.status != 200:
-                            _LOGGER.warning(
-                                "Device at %s returned HTTP %s",
-                                host,
-                                response.status,
-                            )
-                            raise CannotConnect
-
-                        data = await response.json()
-
-            if not isinstance(data, dict):
-                _LOGGER.warning(
-                    "Device at %s returned invalid JSON: %s",
-                    host,
-                    data,
-                )
-                raise CannotConnect
-
-            # Verify we have expected fields in the response
-            if "brightness" not in data:
-                _LOGGER.warning(
-                    "Device at %s returned unexpected data format: %s",
-                    host,
-                    data,
-                )
-                raise CannotConnect
-
-            _LOGGER.info("Successfully connected to IKEA LED device at %s", host)
-            return True
-
-        except (aiohttp.ClientError, asyncio.TimeoutError) as err:
+            # One short attempt, so a wrong address fails fast
+            data = await client.async_get_info(retry=False, timeout=HTTP_PROBE_TIMEOUT)
+        except IkeaLedApiError as err:
             _LOGGER.error("Error connecting to IKEA LED device at %s: %s", host, err)
             raise CannotConnect from err
 
+        if not isinstance(data, dict):
+            _LOGGER.warning(
+                "Device at %s returned invalid JSON: %s",
+                host,
+                data,
+            )
+            raise CannotConnect
+
+        # Verify we have expected fields in the response
+        if "brightness" not in data:
+            _LOGGER.warning(
+                "Device at %s returned unexpected data format: %s",
+                host,
+                data,
+            )
+            raise CannotConnect
+
+        _LOGGER.info("Successfully connected to IKEA LED device at %s", host)
+        return True
+
+
+class OptionsFlowHandler(config_entries.OptionsFlow):
+    """Handle options for an IKEA OBEGRÄNSAD LED device."""
+
+    def __init__(self, config_entry: config_entries.ConfigEntry) -> None:
+        """Initialize options flow."""
+        self._entry = config_entry
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Manage the options."""
+        if user_input is not None:
+            return self.async_create_entry(title="", data=user_input)
+
+        options = self._entry.options
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema(
+                {
+                    vol.Optional(
+                        CONF_MAX_COMMAND_RATE,
+                        default=options.get(CONF_MAX_COMMAND_RATE, DEFAULT_MAX_COMMAND_RATE),
+                    ): vol.All(vol.Coerce(float), vol.Range(min=1, max=50)),
+                    vol.Optional(
+                        CONF_PING_INTERVAL,
+                        default=options.get(CONF_PING_INTERVAL, DEFAULT_PING_INTERVAL),
+                    ): vol.All(vol.Coerce(float), vol.Range(min=1, max=300)),
+                    vol.Optional(
+                        CONF_PING_TIMEOUT,
+                        default=options.get(CONF_PING_TIMEOUT, DEFAULT_PING_TIMEOUT),
+                    ): vol.All(vol.Coerce(float), vol.Range(min=1, max=60)),
+                    vol.Optional(
+                        CONF_STALE_AFTER,
+                        default=options.get(CONF_STALE_AFTER, DEFAULT_STALE_AFTER),
+                    ): vol.All(vol.Coerce(float), vol.Range(min=5, max=3600)),
+                }
+            ),
+        )
+
 
 class CannotConnect(HomeAssistantError):
     """Error to indicate we cannot connect."""
\ No newline at end of file
@@ -1,15 +1,70 @@
 """Constants for the IKEA OBEGRÄNSAD LED Control integration."""
+from datetime import timedelta
 
 DOMAIN = "ikea_obegraensad"
+# hass.data key of the shared connection supervisor
+DATA_SUPERVISOR = f"{DOMAIN}_supervisor"
 
 # Configuration
 CONF_HOST = "host"
+CONF_MAX_COMMAND_RATE = "max_command_rate"
+CONF_PING_INTERVAL = "ping_interval"
+CONF_PING_TIMEOUT = "ping_timeout"
+CONF_STALE_AFTER = "stale_after"
 
 # Default values
 DEFAULT_NAME = "IKEA OBEGRÄNSAD LED"
 DEFAULT_PORT = 80
 # Fallback update interval (WebSocket provides real-time updates)
 DEFAULT_UPDATE_INTERVAL = 300  # 5 minutes as fallback only
+# Maximum brightness/plugin commands per second sent to a single device
+DEFAULT_MAX_COMMAND_RATE = 10
+# Seconds to wait for the device to echo a command before giving up
+DEFAULT_ACK_TIMEOUT = 2.0
+# WebSocket heartbeat: seconds between pings and deadline for the pong
+DEFAULT_PING_INTERVAL = 10
+DEFAULT_PING_TIMEOUT = 5
+# Seconds without a connection before entities are marked unavailable
+DEFAULT_STALE_AFTER = 30
+# Seconds entry setup waits for the first real state before continuing
+BOOTSTRAP_TIMEOUT = 3
+# Last-known state kept across restarts: storage key (one file per entry),
+# the state fields saved and the write-behind delay in seconds
+STORAGE_KEY = f"{DOMAIN}.state"
+STORAGE_VERSION = 1
+PERSISTED_STATE_KEYS = ("brightness", "rotation", "persist_plugin", "schedule", "plugins")
+STORAGE_SAVE_DELAY = 10
+# Reconnect backoff bounds in seconds (exponential with jitter)
+RECONNECT_BACKOFF_MIN = 1
+RECONNECT_BACKOFF_MAX = 60
+# Supervisor limits: simultaneous connect handshakes across all panels and
+# seconds between the start of consecutive panel connections
+DEFAULT_MAX_CONCURRENT_CONNECTS = 8
+DEFAULT_STARTUP_STAGGER = 0.1
+# Firmware REST API: pooled keep-alive connections per panel, timeouts in
+# seconds, retries with exponential backoff for idempotent requests, and the
+# duration above which a request is logged as slow
+HTTP_CONNECTIONS_PER_HOST = 2
+HTTP_KEEPALIVE_TIMEOUT = 30
+HTTP_CONNECT_TIMEOUT = 5
+HTTP_REQUEST_TIMEOUT = 10
+HTTP_RETRIES = 2
+HTTP_RETRY_BACKOFF = 0.25
+HTTP_SLOW_REQUEST = 1.0
+# Single attempt used to check an address in the config flow, in seconds
+HTTP_PROBE_TIMEOUT = 5
+# Message ids handed out when a message is added without one
+MESSAGE_AUTO_ID_MIN = 1000
+MESSAGE_AUTO_ID_MAX = 65535
+# Message repeat count the firmware shows until the message is removed
+MESSAGE_REPEAT_FOREVER = -1
+# Panels a multi-target service call talks to at the same time
+MAX_PARALLEL_SERVICE_CALLS = 16
+
+# get_data snapshot ring: files kept per host, maximum age and total size
+DEFAULT_SNAPSHOTS_PER_HOST = 20
+DEFAULT_SNAPSHOT_MAX_AGE = timedelta(days=7)
+DEFAULT_SNAPSHOT_MAX_BYTES = 10 * 1024 * 1024
 
 # Attributes
 ATTR_PLUGIN = "plugin"
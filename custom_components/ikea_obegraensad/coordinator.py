@@ -2,387 +2,879 @@
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Callable, Mapping
+import contextlib
+from datetime import datetime
 import json
 import logging
-import threading
-import time
-from datetime import timedelta
-from typing import Any, Dict, Optional
+import random
+from typing import TYPE_CHECKING, Any, Dict, Optional
 
 import websockets
-import aiohttp
-from homeassistant.core import HomeAssistant
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
-
-from .const import DOMAIN
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    BOOTSTRAP_TIMEOUT,
+    DEFAULT_ACK_TIMEOUT,
+    DEFAULT_MAX_COMMAND_RATE,
+    DEFAULT_PING_INTERVAL,
+    DEFAULT_PING_TIMEOUT,
+    DEFAULT_STALE_AFTER,
+    DOMAIN,
+    PERSISTED_STATE_KEYS,
+    RECONNECT_BACKOFF_MAX,
+    RECONNECT_BACKOFF_MIN,
+    STORAGE_KEY,
+    STORAGE_SAVE_DELAY,
+    STORAGE_VERSION,
+)
+from .animation import AnimationRunner, FrameSource
+from .api import IkeaLedApiClient, IkeaLedApiError
+from .frame import PIXELS, Frame
+from .graph import GraphFeed
+from .messages import MessageManager
+from .metrics import PanelMetrics
+from .models import DeviceState, PluginIndex, freeze
+from .schedule import ScheduleEntry, device_schedule, next_transition, schedule_payload
+
+if TYPE_CHECKING:
+    from .supervisor import IkeaLedSupervisor
+
+try:
+    from orjson import loads as json_loads
+except ImportError:  # orjson ships with Home Assistant; fall back to the standard library
+    json_loads = json.loads
 
 _LOGGER = logging.getLogger(__name__)
 
+# WebSocket/info payload keys and the state fields they update
+WIRE_FIELDS = {
+    "brightness": "brightness",
+    "rotation": "rotation",
+    "plugin": "plugin",
+    "scheduleActive": "schedule_active",
+    "schedule": "schedule",
+    "plugins": "plugins",
+    # firmware sends 'persist-plugin' (hyphen)
+    "persist-plugin": "persist_plugin",
+}
+
+# Marker for acknowledgements that accept any echoed value
+_ANY = object()
+# Marker for coalesced commands the device never echoes
+_NO_ACK = object()
+
+
+class _PendingAck:
+    """A command waiting for the device to echo the field it changes."""
+
+    __slots__ = ("field", "expected", "future", "sent_at")
+
+    def __init__(self, field: str, expected: Any, future: asyncio.Future[float]) -> None:
+        self.field = field
+        self.expected = expected
+        self.future = future
+        self.sent_at: float | None = None
 
-class IkeaLedCoordinator(DataUpdateCoordinator[dict[str, Any]]):
+
+class IkeaLedCoordinator(DataUpdateCoordinator[DeviceState]):
     """Class to manage fetching data from the IKEA OBEGRÄNSAD LED device."""
 
-    def __init__(self, hass: HomeAssistant, host: str) -> None:
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        host: str,
+        *,
+        max_command_rate: float = DEFAULT_MAX_COMMAND_RATE,
+        ping_interval: float = DEFAULT_PING_INTERVAL,
+        ping_timeout: float = DEFAULT_PING_TIMEOUT,
+        stale_after: float = DEFAULT_STALE_AFTER,
+        supervisor: IkeaLedSupervisor | None = None,
+        entry_id: str | None = None,
+    ) -> None:
         """Initialize."""
         self.host = host
         self.base_url = f"http://{host}/api"
         self.ws_url = f"ws://{host}/ws"
+        # Pooled client for the REST API
+        self.api = IkeaLedApiClient(host)
+        # The client owns its session; close it even when Home Assistant stops
+        # without unloading the entry
+        self._unsub_close: Callable[[], None] | None = hass.bus.async_listen_once(
+            EVENT_HOMEASSISTANT_CLOSE, self._async_close_api
+        )
+        # Messages placed on the panel, used to skip redundant uploads
+        self.messages = MessageManager(hass, self.api)
+        # Counters and latency histograms for diagnostics
+        self.metrics = PanelMetrics()
+        self._connected_once = False
+        # Set once the device reported its state over HTTP or the WebSocket
+        self._has_state = asyncio.Event()
+        self._bootstrap_task: asyncio.Task | None = None
+        # Last-known state saved across restarts; state_restored is set while
+        # the shown state comes from storage and is not yet confirmed
+        self._store: Store | None = (
+            Store(hass, STORAGE_VERSION, f"{STORAGE_KEY}.{entry_id}") if entry_id else None
+        )
+        self._save_pending = False
+        self.state_restored = False
         self.websocket: Optional[websockets.WebSocketClientProtocol] = None
         self.ws_connected = False
-        self._state = {
-            "brightness": 0,
-            "rotation": 0,
-            "plugin": None,
-            # persisted plugin id if device reports it
-            "persistPlugin": None,
-            "scheduleActive": False,
-            "schedule": [],
-            "plugins": []
+        # Replaced, never mutated, on every change; also handed out as self.data
+        self._state = DeviceState()
+        # Derived lookups for the plugin catalogue, rebuilt when it changes
+        self.plugin_index = PluginIndex([])
+        # When the active plugin last changed, used to follow the schedule
+        self.plugin_since: datetime | None = None
+        # Derived state to update when a field changes
+        self._field_handlers: dict[str, Callable[[Any], None]] = {
+            "plugins": self._on_plugins_changed,
+            "plugin": self._on_plugin_changed,
         }
-        self._ws_lock = threading.Lock()
-        self._last_state = {}
-        self._ws_thread = None
-        self._monitor_thread = None
+        # Keys changed since the last listener flush
+        self._changed_keys: set[str] = set()
+        self._flush_handle: asyncio.Handle | None = None
+        # Shared supervisor bounding concurrent connects across all panels
+        self._supervisor = supervisor
+        # Connection health: heartbeat settings, the timer that marks entities
+        # unavailable after a disconnect and the reconnect attempt counter.
+        self._ping_interval = ping_interval
+        self._ping_timeout = ping_timeout
+        self._stale_after = stale_after
+        self._stale_timer: asyncio.TimerHandle | None = None
+        # Loop time the connection was lost (or first attempted), None while connected
+        self._disconnected_since: float | None = None
+        self.reconnect_attempt = 0
+        # Outbound commands, consumed by the writer task of the live connection.
+        # Items are either a payload or the event name of a coalesced command.
+        self._outbound: asyncio.Queue[Dict[str, Any] | str] = asyncio.Queue()
+        # Latest-wins coalescing: newest pending payload per event, the events
+        # already waiting in the queue or on a timer, and last send times.
+        self._min_command_interval = 1 / max_command_rate
+        self._coalesced: dict[str, Dict[str, Any]] = {}
+        self._coalesce_scheduled: set[str] = set()
+        self._coalesce_timers: dict[str, asyncio.TimerHandle] = {}
+        self._last_sent: dict[str, float] = {}
+        # Commands waiting for their echo, by state field
+        self._pending_acks: dict[str, list[_PendingAck]] = {}
+        # Round-trip time of the most recently acknowledged command, in seconds
+        self.last_command_rtt: float | None = None
+        # Last frame pushed to the panel, used to skip unchanged frames
+        self._last_frame: Frame | None = None
+        # Current or most recent client-side animation
+        self.animation: AnimationRunner | None = None
+        # Sensor graph bound to this panel, if any
+        self.graph_feed: GraphFeed | None = None
         
         super().__init__(
             hass,
             _LOGGER,
             name=DOMAIN,
-            update_interval=timedelta(seconds=60),  # WebSocket provides real-time updates
+            # No polling: every WebSocket frame is pushed to listeners directly
+            update_interval=None,
         )
-        
-        # Start WebSocket and monitoring after coordinator is initialized
-        self._start_websocket()
-        self._start_monitoring()
-
-    def _start_websocket(self):
-        """Start the WebSocket connection in a background thread."""
-        def run_async_loop():
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            loop.run_until_complete(self._websocket_loop())
-        
-        self._ws_thread = threading.Thread(target=run_async_loop, daemon=True)
-        self._ws_thread.start()
 
-    def _start_monitoring(self):
-        """Start the state monitoring in a background thread."""
-        def monitor_changes():
-            while True:
-                try:
-                    with self._ws_lock:
-                        current_state = dict(self._state)
-                    
-                    # Check for changes and trigger coordinator updates
-                    changes_detected = False
-                    for key, value in current_state.items():
-                        if key not in self._last_state or self._last_state[key] != value:
-                            if key in self._last_state:  # Don't log initial values
-                                _LOGGER.debug("Change detected: %s changed from %s to %s", 
-                                             key, self._last_state[key], value)
-                                changes_detected = True
-                            self._last_state[key] = value
-                    
-                    # Notify coordinator of changes
-                    if changes_detected:
-                        self.hass.loop.call_soon_threadsafe(
-                            lambda: self.hass.async_create_task(self._on_websocket_change())
-                        )
-                    
-                    time.sleep(0.5)  # Check every 500ms
-                except Exception as ex:
-                    _LOGGER.debug("Error in monitoring loop: %s", ex)
-                    time.sleep(1)
-        
-        self._monitor_thread = threading.Thread(target=monitor_changes, daemon=True)
-        self._monitor_thread.start()
+    async def async_run_connection(self) -> None:
+        """Run the WebSocket connection until cancelled.
+
+        Called by the supervisor from a task on the Home Assistant loop.
+        """
+        self._async_schedule_stale()
+        await self._websocket_loop()
 
     async def _websocket_loop(self):
-        """Main WebSocket connection loop."""
+        """Main WebSocket connection loop.
+
+        The websockets library pings the device every ping_interval and
+        closes the connection when no pong arrives within ping_timeout, so
+        half-open connections surface as a closed socket within seconds.
+        """
         while True:
             try:
-                async with websockets.connect(self.ws_url) as websocket:
+                # Only the handshake holds a supervisor slot
+                slot = self._supervisor.connect_slot() if self._supervisor else contextlib.nullcontext()
+                async with slot:
+                    websocket = await websockets.connect(
+                        self.ws_url,
+                        ping_interval=self._ping_interval,
+                        ping_timeout=self._ping_timeout,
+                    )
+                # Close explicitly so the socket is released on every exit path
+                try:
                     self.websocket = websocket
                     self.ws_connected = True
+                    self.reconnect_attempt = 0
+                    self._async_mark_fresh()
                     _LOGGER.debug("WebSocket connected to %s", self.ws_url)
+                    if self._connected_once:
+                        self.metrics.reconnects += 1
+                        # The panel may have restarted and lost its messages
+                        self.hass.async_create_task(self.messages.async_reconcile())
+                    self._connected_once = True
+                    writer = asyncio.create_task(self._websocket_writer(websocket))
                     
-                    while True:
-                        try:
-                            message = await websocket.recv()
-                            await self._handle_ws_message(message)
-                        except websockets.ConnectionClosed:
-                            break
+                    try:
+                        while True:
+                            try:
+                                message = await websocket.recv()
+                                self._handle_ws_message(message)
+                            except websockets.ConnectionClosed:
+                                break
+                    finally:
+                        writer.cancel()
+                finally:
+                    await websocket.close()
             except Exception as ex:
                 _LOGGER.debug("WebSocket connection error: %s", ex)
             finally:
+                if self.ws_connected:
+                    self._async_schedule_stale()
                 self.ws_connected = False
                 self.websocket = None
+                self._drain_outbound()
             
-            # Wait before reconnecting
-            await asyncio.sleep(5)
+            # Exponential backoff with full jitter so panels that dropped
+            # together (e.g. an AP reboot) do not reconnect in lockstep
+            delay = min(
+                RECONNECT_BACKOFF_MAX, RECONNECT_BACKOFF_MIN * 2 ** self.reconnect_attempt
+            )
+            self.reconnect_attempt += 1
+            await asyncio.sleep(random.uniform(RECONNECT_BACKOFF_MIN, delay))
+
+    @callback
+    def _async_schedule_stale(self) -> None:
+        """Mark the device unavailable unless it reconnects within stale_after."""
+        if self._disconnected_since is None:
+            self._disconnected_since = self.hass.loop.time()
+        if self._stale_timer is None:
+            self._stale_timer = self.hass.loop.call_later(
+                self._stale_after, self._async_mark_stale
+            )
+
+    @callback
+    def _async_mark_stale(self) -> None:
+        """Mark entities unavailable after the connection has been gone too long."""
+        self._stale_timer = None
+        if not self.last_update_success:
+            return
+        _LOGGER.warning(
+            "Lost connection to IKEA OBEGRÄNSAD LED at %s for %ss", self.host, self._stale_after
+        )
+        self.last_update_success = False
+        self.async_update_listeners()
+
+    @callback
+    def _async_mark_fresh(self) -> None:
+        """Cancel a pending staleness timer and restore availability."""
+        self._disconnected_since = None
+        if self._stale_timer is not None:
+            self._stale_timer.cancel()
+            self._stale_timer = None
+        if not self.last_update_success:
+            _LOGGER.info("Reconnected to IKEA OBEGRÄNSAD LED at %s", self.host)
+            self.last_update_success = True
+            self.async_update_listeners()
 
-    async def _handle_ws_message(self, message: str):
+    @callback
+    def _handle_ws_message(self, message: str) -> None:
         """Handle incoming WebSocket messages."""
+        self.metrics.ws_received.record(self.hass.loop.time())
         try:
-            data = json.loads(message)
-            with self._ws_lock:
-                if "brightness" in data:
-                    self._state["brightness"] = data["brightness"]
-                if "rotation" in data:
-                    self._state["rotation"] = data["rotation"]
-                if "plugin" in data:
-                    self._state["plugin"] = data["plugin"]
-                if "scheduleActive" in data:
-                    self._state["scheduleActive"] = data["scheduleActive"]
-                if "schedule" in data:
-                    self._state["schedule"] = data["schedule"]
-                if "plugins" in data:
-                    self._state["plugins"] = data["plugins"]
-                if "persist-plugin" in data:
-                    # firmware sends 'persist-plugin' (hyphen); store under persistPlugin
-                    self._state["persistPlugin"] = data["persist-plugin"]
-        except json.JSONDecodeError as ex:
+            data = json_loads(message)
+        except ValueError as ex:
             _LOGGER.warning("Error parsing WebSocket message: %s", ex)
+            return
+        if not isinstance(data, dict):
+            _LOGGER.debug("Ignoring non-object WebSocket message from %s", self.host)
+            return
+        self._apply_payload(data)
+
+    @callback
+    def _apply_payload(self, data: dict[str, Any], count_unknown: bool = True) -> None:
+        """Apply a state payload from the WebSocket or `GET /api/info`."""
+        self._has_state.set()
+        if self.state_restored:
+            self.state_restored = False
+            self._mark_changed("restored")
+        unknown = self.metrics.ws_unknown_keys
+        state = self._state
+        changes: dict[str, Any] = {}
+        for key, value in data.items():
+            if (field := WIRE_FIELDS.get(key)) is not None:
+                value = freeze(value)
+                if field in self._pending_acks:
+                    self._resolve_acks(field, value)
+                if getattr(state, field) != value:
+                    changes[field] = value
+            elif not count_unknown:
+                continue
+            elif key in unknown:
+                unknown[key] += 1
+            else:
+                _LOGGER.debug("Unknown field %s from %s", key, self.host)
+                unknown[key] = 1
+        if changes:
+            self._update_state(changes)
+
+    @callback
+    def _update_state(self, changes: dict[str, Any]) -> None:
+        """Swap in a snapshot with the changed values and schedule a listener flush."""
+        _LOGGER.debug("Change detected on %s: %s", self.host, changes)
+        self._state = self._state.evolve(**changes)
+        for key, value in changes.items():
+            if (handler := self._field_handlers.get(key)) is not None:
+                handler(value)
+            self._mark_changed(key)
+
+    @callback
+    def _on_plugins_changed(self, plugins: Any) -> None:
+        """Rebuild the plugin lookups."""
+        self.plugin_index = PluginIndex(plugins)
+
+    @callback
+    def _on_plugin_changed(self, plugin: Any) -> None:
+        """Remember when the active plugin changed."""
+        self.plugin_since = dt_util.utcnow()
+        # The new plugin draws over the last frame, so the next one must be sent
+        self._forget_frame()
+
+    @callback
+    def _mark_changed(self, key: str) -> None:
+        """Record a changed key and schedule a listener flush."""
+        self._changed_keys.add(key)
+        if self._flush_handle is None:
+            # Coalesce all changes from the current loop iteration into one update
+            self._flush_handle = self.hass.loop.call_soon(self._async_flush_changes)
+
+    @callback
+    def _async_flush_changes(self) -> None:
+        """Push accumulated state changes to listeners."""
+        self._flush_handle = None
+        if not self._changed_keys:
+            return
+        changed, self._changed_keys = self._changed_keys, set()
+        self.data = self._state
+        if self._store is not None and not changed.isdisjoint(PERSISTED_STATE_KEYS):
+            # Write-behind: a burst of changes costs a single disk write
+            self._save_pending = True
+            self._store.async_delay_save(self._state_to_store, STORAGE_SAVE_DELAY)
+        self._async_update_field_listeners(changed)
+
+    @callback
+    def _state_to_store(self) -> dict[str, Any]:
+        """Return the state saved across restarts."""
+        self._save_pending = False
+        state = self._state.as_dict()
+        return {key: state[key] for key in PERSISTED_STATE_KEYS}
+
+    async def async_restore_state(self) -> None:
+        """Load the state saved before the last restart.
+
+        The restored state is shown right away and flagged as restored until
+        the device confirms it; unchanged values then cause no updates.
+        """
+        if self._store is None or not (stored := await self._store.async_load()):
+            return
+        self._state = self._state.evolve(
+            **{key: freeze(stored[key]) for key in PERSISTED_STATE_KEYS if key in stored}
+        )
+        self.plugin_index = PluginIndex(self._state.plugins)
+        self.data = self._state
+        self.state_restored = True
+
+    @callback
+    def _async_update_field_listeners(self, changed: set[str]) -> None:
+        """Notify only the listeners that depend on a changed field.
+
+        Entities pass the state fields they render as a frozenset coordinator
+        context; listeners without such a context are always notified.
+        """
+        for update_callback, context in list(self._listeners.values()):
+            if not isinstance(context, frozenset) or not context.isdisjoint(changed):
+                update_callback()
+
+    @callback
+    def _resolve_acks(self, key: str, value: Any) -> None:
+        """Resolve commands acknowledged by an echoed field value."""
+        now = self.hass.loop.time()
+        waiting = []
+        for ack in self._pending_acks.pop(key):
+            if ack.future.done():
+                continue
+            if ack.sent_at is None or (ack.expected is not _ANY and ack.expected != value):
+                waiting.append(ack)
+                continue
+            self.last_command_rtt = now - ack.sent_at
+            self.metrics.command_rtt.record(self.last_command_rtt)
+            ack.future.set_result(self.last_command_rtt)
+        if waiting:
+            self._pending_acks[key] = waiting
+
+    @callback
+    def _add_ack(self, field: str, expected: Any) -> _PendingAck:
+        """Register a command that completes when the device echoes field."""
+        ack = _PendingAck(field, expected, self.hass.loop.create_future())
+        self._pending_acks.setdefault(field, []).append(ack)
+        return ack
+
+    async def async_wait_for_ack(
+        self, ack: asyncio.Future[float], timeout: float = DEFAULT_ACK_TIMEOUT
+    ) -> float | None:
+        """Wait until a command is echoed by the device.
+
+        Entities await this so their state reflects the device by the time
+        the service call returns. Returns the round-trip time in seconds, or
+        None if the device did not confirm the command within the timeout.
+        """
+        # asyncio.wait leaves the ack alone when the caller is cancelled, so
+        # the two kinds of cancellation can be told apart
+        done, _ = await asyncio.wait((ack,), timeout=timeout)
+        if not done:
+            ack.cancel()
+            self.metrics.ack_timeouts += 1
+            _LOGGER.debug("Command to %s not acknowledged within %.1fs", self.host, timeout)
+            return None
+        if ack.cancelled():
+            # Connection dropped before the device answered
+            return None
+        return ack.result()
 
     async def async_get_data(self) -> bytes | None:
         """Fetch raw render buffer from device via HTTP `GET /api/data`.
 
         Returns raw bytes on success, or None on failure.
         """
-        url = f"{self.base_url}/data"
-        session = async_get_clientsession(self.hass)
         try:
-            async with session.get(url, timeout=15) as resp:
-                if resp.status == 200:
-                    return await resp.read()
-                _LOGGER.debug("GET %s returned status %s", url, resp.status)
-                return None
-        except Exception as ex:
-            _LOGGER.debug("Failed to fetch data from %s: %s", url, ex)
+            return await self.api.async_get_data()
+        except IkeaLedApiError as ex:
+            _LOGGER.debug("Failed to fetch data from %s: %s", self.host, ex)
             return None
 
-    async def _send_ws_message(self, data: Dict[str, Any]):
-        """Send a message through the WebSocket connection."""
-        if not self.ws_connected or not self.websocket:
+    async def async_get_frame(self) -> Frame | None:
+        """Fetch the render buffer and wrap it as a Frame without copying."""
+        data = await self.async_get_data()
+        if data is None:
+            return None
+        if len(data) != PIXELS:
+            _LOGGER.debug("Unexpected render buffer size %s from %s", len(data), self.host)
+            return None
+        return Frame(data)
+
+    async def _websocket_writer(self, websocket) -> None:
+        """Send queued commands; the only task that writes to the socket."""
+        while True:
+            item = await self._outbound.get()
+            # Count the item just taken as part of the backlog
+            self.metrics.record_queue_depth(self._outbound.qsize() + 1)
+            now = self.hass.loop.time()
+            if isinstance(item, str):
+                # Coalesced command: send whatever the newest value is now
+                self._coalesce_scheduled.discard(item)
+                data = self._coalesced.pop(item, None)
+                if data is None:
+                    continue
+                self._last_sent[item] = now
+                for ack in self._pending_acks.get(item, ()):
+                    if ack.sent_at is None:
+                        ack.sent_at = now
+            else:
+                data, ack = item
+                if ack is not None:
+                    ack.sent_at = now
+            try:
+                await websocket.send(json.dumps(data))
+                self.metrics.ws_sent += 1
+            except websockets.ConnectionClosed:
+                _LOGGER.debug("WebSocket connection closed while sending message")
+                return
+            except Exception as ex:
+                _LOGGER.warning("Error sending WebSocket message: %s", ex)
+
+    @callback
+    def _drain_outbound(self) -> None:
+        """Drop commands queued for a connection that no longer exists."""
+        while not self._outbound.empty():
+            self._outbound.get_nowait()
+        for timer in self._coalesce_timers.values():
+            timer.cancel()
+        self._coalesce_timers.clear()
+        self._coalesce_scheduled.clear()
+        self._coalesced.clear()
+        # The device may have rebooted; resend the next frame in full
+        self._forget_frame()
+        for acks in self._pending_acks.values():
+            for ack in acks:
+                ack.future.cancel()
+        self._pending_acks.clear()
+
+    @callback
+    def _async_send_command(
+        self, data: Dict[str, Any], ack_field: str, expected: Any = _ANY
+    ) -> asyncio.Future[float]:
+        """Queue a command for the WebSocket writer task.
+
+        Returns a future resolving to the round-trip time once the device
+        echoes ack_field (with the expected value, if given).
+        """
+        if not self.ws_connected:
             raise ConnectionError("WebSocket connection is not available")
-        
-        try:
-            await self.websocket.send(json.dumps(data))
-        except websockets.ConnectionClosed:
-            _LOGGER.debug("WebSocket connection closed while sending message")
-            self.ws_connected = False
-            raise
-        except Exception as ex:
-            _LOGGER.warning("Error sending WebSocket message: %s", ex)
-            raise
-
-    def _send_ws_command(self, data: Dict[str, Any]) -> None:
-        """Helper method to send WebSocket commands."""
+        ack = self._add_ack(ack_field, expected)
+        self._outbound.put_nowait((data, ack))
+        return ack.future
+
+    @callback
+    def _async_send_coalesced(
+        self,
+        event: str,
+        data: Dict[str, Any],
+        expected: Any,
+        min_interval: float | None = None,
+    ) -> asyncio.Future[float] | None:
+        """Queue a command where only the most recent value per event matters.
+
+        Newer values replace pending ones, and each event is sent at most once
+        per minimum command interval; the last value is always delivered.
+        The event name doubles as the state field acknowledging the command,
+        and superseded commands are acknowledged together with the newest one.
+        Commands sent with expected=_NO_ACK return None instead of a future.
+        """
         if not self.ws_connected:
             raise ConnectionError("WebSocket connection is not available")
-        
-        # Create a new event loop for this thread
-        try:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            loop.run_until_complete(self._send_ws_message(data))
-        finally:
-            loop.close()
-
-    async def _on_websocket_change(self) -> None:
-        """Handle WebSocket state changes."""
+        future = None
+        if expected is not _NO_ACK:
+            for ack in self._pending_acks.get(event, ()):
+                ack.expected = expected
+                ack.sent_at = None
+            future = self._add_ack(event, expected).future
+        self._coalesced[event] = data
+        if event in self._coalesce_scheduled:
+            return future
+        self._coalesce_scheduled.add(event)
+        if min_interval is None:
+            min_interval = self._min_command_interval
+        delay = self._last_sent.get(event, 0) + min_interval - self.hass.loop.time()
+        if delay <= 0:
+            self._outbound.put_nowait(event)
+        else:
+            self._coalesce_timers[event] = self.hass.loop.call_later(
+                delay, self._async_release_coalesced, event
+            )
+        return future
+
+    @callback
+    def _async_release_coalesced(self, event: str) -> None:
+        """Hand a rate-limited coalesced command to the writer task."""
+        self._coalesce_timers.pop(event, None)
+        self._outbound.put_nowait(event)
+
+    async def _async_bootstrap(self) -> None:
+        """Load the initial state over HTTP while the WebSocket connects."""
+        start = self.hass.loop.time()
         try:
-            # Update the coordinator's data with current state
-            with self._ws_lock:
-                current_data = dict(self._state)
-            
-            self.data = current_data
-            self.async_update_listeners()
-            _LOGGER.debug("WebSocket change triggered HA update")
-                
-        except Exception as ex:
-            _LOGGER.debug("Failed to handle WebSocket change: %s", ex)
+            data = await self.api.async_get_info()
+        except IkeaLedApiError as ex:
+            _LOGGER.debug("Bootstrap of %s failed: %s", self.host, ex)
+            return
+        # State pushed over the WebSocket in the meantime is newer
+        if self._has_state.is_set() or not isinstance(data, dict):
+            return
+        _LOGGER.debug(
+            "Bootstrapped %s over HTTP in %.0f ms", self.host, (self.hass.loop.time() - start) * 1000
+        )
+        # The info response has more fields than the WebSocket pushes; only
+        # unknown WebSocket keys are counted
+        self._apply_payload(data, count_unknown=False)
 
-    async def _async_update_data(self) -> dict[str, Any]:
-        """Update data via WebSocket state."""
-        try:
-            # Return current state from WebSocket
-            with self._ws_lock:
-                current_state = dict(self._state)
-            
-            # Log WebSocket connection status
-            ws_status = "connected" if self.ws_connected else "disconnected"
-            _LOGGER.debug("Data update completed, WebSocket: %s", ws_status)
-            
-            return current_state
-            
-        except Exception as ex:
-            _LOGGER.exception("Error fetching data from IKEA LED device")
-            raise UpdateFailed(f"Error communicating with device at {self.host}: {ex}") from ex
+    async def _async_update_data(self) -> DeviceState:
+        """Update data via WebSocket state.
+
+        Until the device has reported its state once, the state is fetched
+        over HTTP in parallel with the WebSocket handshake. Without restored
+        state the refresh waits for whichever answers first, up to
+        BOOTSTRAP_TIMEOUT.
+        """
+        if not self._has_state.is_set():
+            if self._bootstrap_task is None or self._bootstrap_task.done():
+                self._bootstrap_task = self.hass.async_create_task(self._async_bootstrap())
+        # Restored state can be shown right away
+        if not self._has_state.is_set() and not self.state_restored:
+            try:
+                await asyncio.wait_for(self._has_state.wait(), BOOTSTRAP_TIMEOUT)
+            except asyncio.TimeoutError:
+                _LOGGER.debug("No state from %s within %ss", self.host, BOOTSTRAP_TIMEOUT)
+        # A manual refresh must not make a stale panel available again
+        if (
+            self._disconnected_since is not None
+            and self.hass.loop.time() - self._disconnected_since >= self._stale_after
+        ):
+            raise UpdateFailed(
+                f"No connection to {self.host} for more than {self._stale_after}s"
+            )
+        # Log WebSocket connection status
+        ws_status = "connected" if self.ws_connected else "disconnected"
+        _LOGGER.debug("Data update completed, WebSocket: %s", ws_status)
+        # The snapshot is immutable, so it is shared rather than copied
+        return self._state
 
     # LED Control Methods
-    def set_brightness(self, brightness: int) -> None:
+    # Each command returns a future that resolves to the round-trip time once
+    # the device echoes the change; see async_wait_for_ack.
+    async def async_set_brightness(self, brightness: int) -> asyncio.Future[float]:
         """Set the brightness value (0-255)."""
         if not (0 <= brightness <= 255):
             raise ValueError("Brightness must be between 0 and 255")
         
-        self._send_ws_command({
+        return self._async_send_coalesced("brightness", {
             "event": "brightness",
             "brightness": brightness
-        })
+        }, brightness)
 
-    def set_plugin(self, plugin_id: int) -> None:
+    async def async_set_plugin(self, plugin_id: int) -> asyncio.Future[float]:
         """Set the active plugin."""
-        self._send_ws_command({
+        self.async_stop_animation()
+        # The plugin draws over whatever frame was pushed last
+        self._forget_frame()
+        return self._async_send_coalesced("plugin", {
             "event": "plugin",
             "plugin": plugin_id
-        })
+        }, plugin_id)
+
+    async def async_push_frame(self, frame: Frame, force: bool = False) -> int:
+        """Show a frame on the panel, stopping any running animation.
+
+        The frame is diffed against the last frame sent and nothing is sent
+        when no pixel changed, unless force is set. Frames are coalesced, so
+        if the connection cannot keep up only the newest frame is delivered.
+        Returns the number of changed pixels (0 when the push was skipped).
+        """
+        self.async_stop_animation()
+        return self._async_push_frame(frame, force)
+
+    async def async_push_animation_frame(self, frame: Frame) -> int:
+        """Push a frame on behalf of the running animation."""
+        return self._async_push_frame(frame, False)
+
+    @property
+    def queue_depth(self) -> int:
+        """Return the number of commands waiting for the writer task."""
+        return self._outbound.qsize()
+
+    @property
+    def displayed_frame(self) -> Frame | None:
+        """Return the frame on the panel, or None while a plugin or message draws."""
+        return self._last_frame
+
+    @callback
+    def _forget_frame(self) -> None:
+        """Drop the mirrored frame after something else drew over it."""
+        if self._last_frame is not None:
+            self._last_frame = None
+            self._mark_changed("frame")
+
+    @property
+    def frame_pending(self) -> bool:
+        """Return True while a pushed frame is still waiting to be sent."""
+        return "screen" in self._coalesced
+
+    @callback
+    def _async_push_frame(self, frame: Frame, force: bool) -> int:
+        """Diff and queue a frame."""
+        if force or self._last_frame is None:
+            changed = PIXELS
+        else:
+            changed = len(frame.diff(self._last_frame))
+            if not changed:
+                return 0
+        self._async_send_coalesced(
+            "screen",
+            # The firmware accepts full frames only, one value per pixel
+            {"event": "screen", "data": list(frame.buffer)},
+            _NO_ACK,
+            min_interval=0,
+        )
+        self._last_frame = frame
+        self._mark_changed("frame")
+        return changed
+
+    @callback
+    def async_start_animation(
+        self, source: FrameSource, fps: float, duration: float | None = None
+    ) -> AnimationRunner:
+        """Run an animation on the panel, replacing any running one.
 
-    def set_rotation(self, direction: str) -> None:
+        The animation stops when another plugin, frame or message is sent.
+        """
+        self.async_stop_animation()
+        self.animation = AnimationRunner(self.hass, self, source, fps, duration)
+        self.animation.async_start()
+        return self.animation
+
+    @callback
+    def async_stop_animation(self) -> None:
+        """Stop the running animation, keeping its statistics."""
+        if self.animation is not None:
+            self.animation.async_cancel()
+
+    async def async_bind_graph(self, feed: GraphFeed) -> None:
+        """Show a live sensor graph, replacing any graph already bound."""
+        self.async_unbind_graph()
+        self.graph_feed = feed
+        await feed.async_start()
+
+    @callback
+    def async_unbind_graph(self) -> None:
+        """Stop updating the bound sensor graph."""
+        if self.graph_feed is not None:
+            self.graph_feed.async_stop()
+            self.graph_feed = None
+
+    async def async_set_rotation(self, direction: str) -> asyncio.Future[float]:
         """Rotate the display (direction should be 'left' or 'right')."""
         if direction not in ['left', 'right']:
             raise ValueError("Direction must be either 'left' or 'right'")
         
-        self._send_ws_command({
+        return self._async_send_command({
             "event": "rotate",
             "direction": direction
-        })
+        }, "rotation")
 
-    def persist_plugin(self) -> None:
+    async def async_persist_plugin(self) -> asyncio.Future[float]:
         """Persist the currently active plugin on the device.
 
         This triggers the device to save the active plugin as the persisted choice
         (handled by the firmware's pluginManager.persistActivePlugin()).
         """
-        self._send_ws_command({
+        return self._async_send_command({
             "event": "persist-plugin"
-        })
+        }, "persist_plugin")
 
     # State Access Methods
     def get_brightness(self) -> int:
         """Get the current brightness value (0-255)."""
-        with self._ws_lock:
-            return self._state["brightness"]
+        return self._state.brightness
 
     def get_rotation(self) -> int:
         """Get the current rotation value (0-3)."""
-        with self._ws_lock:
-            return self._state["rotation"]
+        return self._state.rotation
 
     def get_active_plugin(self) -> Optional[int]:
         """Get the currently active plugin ID."""
-        with self._ws_lock:
-            return self._state["plugin"]
+        return self._state.plugin
 
-    def get_available_plugins(self) -> list:
-        """Get list of available plugins."""
-        with self._ws_lock:
-            return self._state["plugins"]
+    def get_available_plugins(self) -> tuple[Mapping[str, Any], ...]:
+        """Get the available plugins."""
+        return self._state.plugins
 
     def get_schedule_state(self) -> bool:
         """Get whether the schedule is active."""
-        with self._ws_lock:
-            return self._state["scheduleActive"]
+        return self._state.schedule_active
 
-    def get_schedule(self) -> list:
+    def get_schedule(self) -> tuple[Any, ...]:
         """Get the current schedule."""
-        with self._ws_lock:
-            return self._state["schedule"]
+        return self._state.schedule
+
+    def schedule_matches(self, entries: tuple[ScheduleEntry, ...]) -> bool:
+        """Return True if the device reports exactly this schedule."""
+        return device_schedule(self._state.schedule) == entries
 
-    async def async_refresh_after_command(self) -> None:
-        """Refresh data after sending a command - WebSocket will handle updates automatically."""
-        # Small delay to allow WebSocket to receive the update
-        await asyncio.sleep(0.1)
+    def next_schedule_transition(
+        self, entries: tuple[ScheduleEntry, ...] | None = None
+    ) -> tuple[ScheduleEntry, datetime] | None:
+        """Return the next plugin of the running schedule and when it starts.
+
+        entries overrides the schedule last reported by the device, e.g. one
+        that was just sent and not echoed yet.
+        """
+        state = self._state
+        if not state.schedule_active:
+            return None
+        if entries is None:
+            entries = device_schedule(state.schedule)
+        return next_transition(entries or (), state.plugin, self.plugin_since)
 
     async def async_shutdown(self) -> None:
         """Shutdown coordinator."""
         self.ws_connected = False
+        self.async_stop_animation()
+        self.async_unbind_graph()
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if self._stale_timer is not None:
+            self._stale_timer.cancel()
+            self._stale_timer = None
+        if self._bootstrap_task is not None:
+            self._bootstrap_task.cancel()
+        if self._store is not None and self._save_pending:
+            await self._store.async_save(self._state_to_store())
+        self.messages.async_shutdown()
+        if self._unsub_close is not None:
+            self._unsub_close()
+            self._unsub_close = None
+        await self.api.async_close()
         _LOGGER.info("Shutting down IKEA LED coordinator")
 
-    # --- HTTP helper methods to call firmware API endpoints ---
-    async def async_set_schedule(self, schedule_json: str) -> bool:
-        """Send schedule JSON string to device via HTTP POST.
+    async def _async_close_api(self, event: Event) -> None:
+        """Close the HTTP session when Home Assistant shuts down."""
+        self._unsub_close = None
+        await self.api.async_close()
 
-        The firmware expects form-data with key 'schedule'. Returns True on success.
-        """
-        url = f"{self.base_url}/schedule"
-        session = async_get_clientsession(self.hass)
+    # --- HTTP helper methods to call firmware API endpoints ---
+    async def _async_api_call(self, method: str, path: str, **kwargs: Any) -> bool:
+        """Call a REST endpoint through the pooled client. Returns True on success."""
         try:
-            async with session.post(url, data={"schedule": schedule_json}, timeout=10) as resp:
-                return resp.status == 200
-        except aiohttp.ClientError as ex:
-            _LOGGER.debug("Failed to set schedule via %s: %s", url, ex)
+            await self.api.async_request(method, path, **kwargs)
+        except IkeaLedApiError as ex:
+            _LOGGER.debug("Request to %s failed: %s", self.host, ex)
             return False
+        return True
+
+    async def async_set_schedule(self, entries: tuple[ScheduleEntry, ...]) -> bool:
+        """Send a compiled schedule to the device via HTTP POST.
+
+        The firmware expects form-data with key 'schedule'. Nothing is sent
+        when the device already runs this schedule. Returns True on success.
+        """
+        if self.schedule_matches(entries):
+            _LOGGER.debug("Schedule on %s is unchanged, not sending", self.host)
+            return True
+        return await self._async_api_call("POST", "schedule", data={"schedule": schedule_payload(entries)})
 
     async def async_clear_schedule(self) -> bool:
-        url = f"{self.base_url}/schedule/clear"
-        session = async_get_clientsession(self.hass)
-        try:
-            async with session.get(url, timeout=10) as resp:
-                return resp.status == 200
-        except aiohttp.ClientError as ex:
-            _LOGGER.debug("Failed to clear schedule: %s", ex)
-            return False
+        return await self._async_api_call("GET", "schedule/clear")
 
     async def async_start_schedule(self) -> bool:
-        url = f"{self.base_url}/schedule/start"
-        session = async_get_clientsession(self.hass)
-        try:
-            async with session.get(url, timeout=10) as resp:
-                return resp.status == 200
-        except aiohttp.ClientError as ex:
-            _LOGGER.debug("Failed to start schedule: %s", ex)
-            return False
+        return await self._async_api_call("GET", "schedule/start")
 
     async def async_stop_schedule(self) -> bool:
-        url = f"{self.base_url}/schedule/stop"
-        session = async_get_clientsession(self.hass)
-        try:
-            async with session.get(url, timeout=10) as resp:
-                return resp.status == 200
-        except aiohttp.ClientError as ex:
-            _LOGGER.debug("Failed to stop schedule: %s", ex)
-            return False
+        return await self._async_api_call("GET", "schedule/stop")
 
-    async def async_add_message(self, text: str, repeat: int = 1, id: int = 0, delay: int = 50, graph: list | None = None, miny: int = 0, maxy: int = 15) -> bool:
-        """Add a message via the HTTP API. graph is a list of ints converted to CSV string."""
-        url = f"{self.base_url}/message"
-        params = {
-            "text": text,
-            "repeat": str(repeat),
-            "id": str(id),
-            "delay": str(delay),
-            "miny": str(miny),
-            "maxy": str(maxy),
-        }
-        if graph:
-            params["graph"] = ",".join(str(x) for x in graph)
+    async def async_add_message(self, text: str, repeat: int = 1, id: int = 0, delay: int = 50, graph: list | None = None, miny: int = 0, maxy: int = 15, ttl: float | None = None) -> int | None:
+        """Add a message via the HTTP API unless the panel already shows it.
 
-        session = async_get_clientsession(self.hass)
+        graph is a list of ints converted to CSV string. Returns the message
+        id, or None on failure.
+        """
+        self.async_stop_animation()
+        # A scrolling message overwrites the frame on the panel
+        self._forget_frame()
         try:
-            async with session.get(url, params=params, timeout=10) as resp:
-                return resp.status == 200
-        except aiohttp.ClientError as ex:
+            return await self.messages.async_add(text, repeat, id, delay, graph, miny, maxy, ttl)
+        except IkeaLedApiError as ex:
             _LOGGER.debug("Failed to add message: %s", ex)
-            return False
+            return None
 
     async def async_remove_message(self, id: int) -> bool:
-        url = f"{self.base_url}/removemessage"
-        session = async_get_clientsession(self.hass)
         try:
-            async with session.get(url, params={"id": str(id)}, timeout=10) as resp:
-                return resp.status == 200
-        except aiohttp.ClientError as ex:
+            await self.messages.async_remove(id)
+        except IkeaLedApiError as ex:
             _LOGGER.debug("Failed to remove message: %s", ex)
             return False
+        return True
 
     async def async_clear_storage(self) -> bool:
-        url = f"{self.base_url}/storage/clear"
-        session = async_get_clientsession(self.hass)
-        try:
-            async with session.get(url, timeout=10) as resp:
-                return resp.status == 200
-        except aiohttp.ClientError as ex:
-            _LOGGER.debug("Failed to clear storage: %s", ex)
-            return False
\ No newline at end of file
+        return await self._async_api_call("GET", "storage/clear")
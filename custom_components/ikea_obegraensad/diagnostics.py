@@ -0,0 +1,45 @@
+"""Diagnostics support for IKEA OBEGRÄNSAD LED Control."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+from .coordinator import IkeaLedCoordinator
+from .supervisor import async_get_supervisor
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator: IkeaLedCoordinator = hass.data[DOMAIN][entry.entry_id]
+    animation = coordinator.animation
+    graph = coordinator.graph_feed
+    return {
+        "entry": {"data": dict(entry.data), "options": dict(entry.options)},
+        "connection": {
+            "ws_connected": coordinator.ws_connected,
+            "available": coordinator.last_update_success,
+            "reconnect_attempt": coordinator.reconnect_attempt,
+            "state_restored": coordinator.state_restored,
+            "queue_depth": coordinator.queue_depth,
+            "last_command_rtt": coordinator.last_command_rtt,
+        },
+        "state": coordinator.data.as_dict() if coordinator.data else None,
+        "state_version": coordinator.data.version if coordinator.data else None,
+        "metrics": coordinator.metrics.as_dict(hass.loop.time()),
+        "http": {
+            "total": coordinator.api.totals.as_dict(),
+            "endpoints": {path: stats.as_dict() for path, stats in coordinator.api.stats.items()},
+        },
+        "messages": {
+            "mirrored": coordinator.messages.messages,
+            "uploads_skipped": coordinator.messages.uploads_skipped,
+        },
+        "animation": animation.stats if animation is not None else None,
+        "graph": {"entity_id": graph.entity_id, "message_id": graph.message_id} if graph else None,
+        "supervisor": async_get_supervisor(hass).async_health(),
+    }
@@ -0,0 +1,143 @@
+"""Frame buffer model for IKEA OBEGRÄNSAD LED Control."""
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+import struct
+import zlib
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; pure Python fallbacks are used
+    np = None
+
+WIDTH = 16
+HEIGHT = 16
+PIXELS = WIDTH * HEIGHT
+# Size of a 1 bit per pixel frame, rows first, most significant bit leftmost
+PACKED_SIZE = PIXELS // 8
+
+# Maps on/off buffers (0/1 per pixel) to black/white
+_ON_OFF_TABLE = bytes([0] + [255] * 255)
+
+
+class Frame:
+    """A 16×16 render buffer, one byte per pixel.
+
+    The frame is a read-only view over the bytes returned by the device, so
+    wrapping a response does not copy it.
+    """
+
+    __slots__ = ("_view", "_digest")
+
+    def __init__(self, buffer: bytes | bytearray | memoryview) -> None:
+        """Wrap a 256 byte buffer."""
+        view = memoryview(buffer).cast("B")
+        if len(view) != PIXELS:
+            raise ValueError(f"Frame buffer must be {PIXELS} bytes, got {len(view)}")
+        self._view = view.toreadonly()
+        self._digest: int | None = None
+
+    @property
+    def buffer(self) -> memoryview:
+        """Return the flat pixel buffer."""
+        return self._view
+
+    @property
+    def digest(self) -> int:
+        """Return a cheap checksum used to detect changed frames."""
+        if self._digest is None:
+            self._digest = zlib.crc32(self._view)
+        return self._digest
+
+    @classmethod
+    def from_packed(cls, data: bytes) -> Frame:
+        """Build a frame from 1 bit (32 bytes) or 8 bit (256 bytes) per pixel data."""
+        if len(data) == PIXELS:
+            return cls(data)
+        if len(data) != PACKED_SIZE:
+            raise ValueError(f"Packed frame must be {PACKED_SIZE} or {PIXELS} bytes, got {len(data)}")
+        if np is not None:
+            return cls(np.unpackbits(np.frombuffer(data, dtype=np.uint8)).tobytes())
+        return cls(bytes((byte >> bit) & 1 for byte in data for bit in range(7, -1, -1)))
+
+    @classmethod
+    def parse(cls, value: str | list) -> Frame:
+        """Parse frame data given to a service.
+
+        Accepts a JSON list (256 values or 16 rows of 16), or a hex or base64
+        string holding a 1 bit or 8 bit packed frame.
+        """
+        if isinstance(value, str):
+            text = value.strip()
+            if text.startswith("["):
+                value = json.loads(text)
+            else:
+                try:
+                    return cls.from_packed(bytes.fromhex(text))
+                except ValueError:
+                    pass
+                try:
+                    return cls.from_packed(base64.b64decode(text, validate=True))
+                except binascii.Error as ex:
+                    raise ValueError("Frame is neither a JSON list, hex nor base64") from ex
+        if not isinstance(value, list):
+            raise ValueError("Frame must be a list of pixel values")
+        if value and isinstance(value[0], list):
+            if not all(isinstance(row, list) for row in value):
+                raise ValueError("Frame rows must all be lists")
+            value = [pixel for row in value for pixel in row]
+        if not all(type(pixel) is int and 0 <= pixel <= 255 for pixel in value):
+            raise ValueError("Pixel values must be whole numbers from 0 to 255")
+        return cls(bytes(value))
+
+    def diff(self, previous: Frame) -> list[int]:
+        """Return the indices of pixels that differ from the previous frame."""
+        if np is not None:
+            current = np.frombuffer(self._view, dtype=np.uint8)
+            return np.flatnonzero(current != np.frombuffer(previous._view, dtype=np.uint8)).tolist()
+        return [i for i, (a, b) in enumerate(zip(self._view, previous._view)) if a != b]
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Frame):
+            return NotImplemented
+        return self._view == other._view
+
+    def __hash__(self) -> int:
+        return self.digest
+
+    def to_png(self, scale: int = 16) -> bytes:
+        """Encode the frame as a grayscale PNG, each pixel scale×scale."""
+        pixels = bytes(self._view)
+        if max(pixels) <= 1:
+            pixels = pixels.translate(_ON_OFF_TABLE)
+        size = WIDTH * scale
+
+        if np is not None:
+            image = np.frombuffer(pixels, dtype=np.uint8).reshape(HEIGHT, WIDTH)
+            image = image.repeat(scale, axis=0).repeat(scale, axis=1)
+            # Prefix every scanline with filter type 0 (None)
+            raw = np.hstack((np.zeros((size, 1), dtype=np.uint8), image)).tobytes()
+        else:
+            lines = []
+            for y in range(HEIGHT):
+                line = b"\x00" + bytes(
+                    value for value in pixels[y * WIDTH:(y + 1) * WIDTH] for _ in range(scale)
+                )
+                lines.extend([line] * scale)
+            raw = b"".join(lines)
+
+        return b"".join(
+            (
+                b"\x89PNG\r\n\x1a\n",
+                _png_chunk(b"IHDR", struct.pack(">IIBBBBB", size, size, 8, 0, 0, 0, 0)),
+                _png_chunk(b"IDAT", zlib.compress(raw)),
+                _png_chunk(b"IEND", b""),
+            )
+        )
+
+
+def _png_chunk(tag: bytes, data: bytes) -> bytes:
+    """Build a PNG chunk."""
+    return struct.pack(">I", len(data)) + tag + data + struct.pack(">I", zlib.crc32(tag + data))
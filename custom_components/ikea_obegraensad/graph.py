@@ -0,0 +1,236 @@
+"""Live sensor graphs for IKEA OBEGRÄNSAD LED Control."""
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from datetime import timedelta
+import logging
+import math
+from typing import TYPE_CHECKING
+
+from homeassistant.const import STATE_UNAVAILABLE, STATE_UNKNOWN
+from homeassistant.core import Event, HomeAssistant, State, callback
+from homeassistant.helpers.event import async_track_state_change_event
+from homeassistant.util import dt as dt_util
+
+from .const import MESSAGE_REPEAT_FOREVER
+from .frame import WIDTH
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; pure Python fallbacks are used
+    np = None
+
+if TYPE_CHECKING:
+    from .coordinator import IkeaLedCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def _state_value(state: State | None) -> float | None:
+    """Return the numeric value of a state, or None."""
+    if state is None or state.state in (STATE_UNKNOWN, STATE_UNAVAILABLE):
+        return None
+    try:
+        value = float(state.state)
+    except ValueError:
+        return None
+    return value if math.isfinite(value) else None
+
+
+def downsample(
+    times: list[float], values: list[float], start: float, end: float, columns: int = WIDTH
+) -> list[float]:
+    """Reduce a time series to one value per column.
+
+    The window is split into equal time buckets. Each bucket keeps the point
+    that forms the largest triangle with the previously chosen point and the
+    mean of the next bucket (Largest-Triangle-Three-Buckets), which keeps
+    peaks and dips visible. Empty buckets repeat the last value, since a
+    sensor keeps its state until it changes.
+    """
+    if not values:
+        return []
+    span = (end - start) / columns
+    if np is not None:
+        t = np.asarray(times, dtype=float)
+        v = np.asarray(values, dtype=float)
+        index = np.clip(((t - start) / span).astype(int), 0, columns - 1)
+        bounds = np.searchsorted(index, np.arange(columns + 1))
+        buckets = [(t[a:b], v[a:b]) for a, b in zip(bounds[:-1], bounds[1:])]
+        means = [(bt.mean(), bv.mean()) if len(bt) else None for bt, bv in buckets]
+    else:
+        buckets = [([], []) for _ in range(columns)]
+        for time, value in zip(times, values):
+            bucket = buckets[min(columns - 1, max(0, int((time - start) / span)))]
+            bucket[0].append(time)
+            bucket[1].append(value)
+        means = [
+            (sum(bt) / len(bt), sum(bv) / len(bv)) if bt else None for bt, bv in buckets
+        ]
+
+    result: list[float] = []
+    # Start from the value in effect before the first bucket
+    previous = (times[0], values[0])
+    for column, (bucket_times, bucket_values) in enumerate(buckets):
+        if not len(bucket_times):
+            result.append(previous[1])
+            continue
+        following = next((m for m in means[column + 1:] if m is not None), None)
+        if following is None or len(bucket_times) == 1:
+            chosen = len(bucket_times) - 1 if following is None else 0
+        elif np is not None:
+            areas = np.abs(
+                (previous[0] - following[0]) * (bucket_values - previous[1])
+                - (previous[0] - bucket_times) * (following[1] - previous[1])
+            )
+            chosen = int(areas.argmax())
+        else:
+            areas = [
+                abs((previous[0] - following[0]) * (value - previous[1])
+                    - (previous[0] - time) * (following[1] - previous[1]))
+                for time, value in zip(bucket_times, bucket_values)
+            ]
+            chosen = areas.index(max(areas))
+        previous = (float(bucket_times[chosen]), float(bucket_values[chosen]))
+        result.append(previous[1])
+    return result
+
+
+def scale_graph(values: list[float]) -> tuple[list[int], int, int]:
+    """Convert values to the integer graph the firmware expects.
+
+    Values are sent as offsets from the minimum, scaled by a power of ten so
+    small ranges (e.g. 21.2 to 21.9 °C) still span the full panel height and
+    large ones (e.g. 101325 Pa) stay within the firmware's 16-bit range.
+    Returns the graph with miny/maxy.
+    """
+    low, high = min(values), max(values)
+    factor = 1.0
+    if high > low:
+        factor = 10.0 ** math.ceil(math.log10(WIDTH / (high - low)))
+    graph = [round((value - low) * factor) for value in values]
+    return graph, 0, max(1, math.ceil((high - low) * factor))
+
+
+class GraphFeed:
+    """Keep a graph message on a panel bound to a sensor.
+
+    History is loaded from the recorder once when the feed starts; after that
+    new states are appended as they arrive and the graph is recomputed from
+    memory, at most once per update interval.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        coordinator: IkeaLedCoordinator,
+        entity_id: str,
+        window: timedelta,
+        message_id: int,
+        text: str = "",
+        update_interval: float = 10,
+    ) -> None:
+        """Initialize the feed."""
+        self.hass = hass
+        self._coordinator = coordinator
+        self.entity_id = entity_id
+        self._window = window.total_seconds()
+        self.message_id = message_id
+        self._text = text
+        self._update_interval = update_interval
+        self._points: deque[tuple[float, float]] = deque()
+        self._unsub = None
+        self._push_handle: asyncio.TimerHandle | None = None
+        self._push_task: asyncio.Task | None = None
+        self._stopped = False
+        self._last_push = 0.0
+        self._last_graph: tuple[list[int], int, int] | None = None
+
+    async def async_start(self) -> None:
+        """Load history, subscribe to state changes and push the first graph."""
+        # Imported here so the recorder is only needed when a graph is bound
+        from homeassistant.components.recorder import get_instance, history
+
+        start = dt_util.utcnow() - timedelta(seconds=self._window)
+        states = await get_instance(self.hass).async_add_executor_job(
+            lambda: history.state_changes_during_period(
+                self.hass,
+                start,
+                entity_id=self.entity_id,
+                no_attributes=True,
+                include_start_time_state=True,
+            )
+        )
+        if self._stopped:
+            return
+        for state in states.get(self.entity_id, []):
+            if (value := _state_value(state)) is not None:
+                self._points.append((state.last_updated.timestamp(), value))
+
+        self._unsub = async_track_state_change_event(
+            self.hass, [self.entity_id], self._async_state_changed
+        )
+        await self._async_push()
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop following the sensor and drop any push in flight."""
+        self._stopped = True
+        if self._unsub is not None:
+            self._unsub()
+            self._unsub = None
+        if self._push_handle is not None:
+            self._push_handle.cancel()
+            self._push_handle = None
+        if self._push_task is not None:
+            self._push_task.cancel()
+            self._push_task = None
+
+    @callback
+    def _async_state_changed(self, event: Event) -> None:
+        """Append a new sensor value and schedule a graph update."""
+        new_state = event.data.get("new_state")
+        if (value := _state_value(new_state)) is None:
+            return
+        self._points.append((new_state.last_updated.timestamp(), value))
+        if self._push_handle is not None:
+            return
+        delay = max(0.0, self._last_push + self._update_interval - self.hass.loop.time())
+        self._push_handle = self.hass.loop.call_later(delay, self._async_schedule_push)
+
+    @callback
+    def _async_schedule_push(self) -> None:
+        """Start a graph push from the update timer."""
+        self._push_handle = None
+        self._push_task = self.hass.async_create_task(self._async_push())
+
+    async def _async_push(self) -> None:
+        """Recompute the graph and send it when it changed."""
+        if self._stopped:
+            return
+        self._last_push = self.hass.loop.time()
+        end = dt_util.utcnow().timestamp()
+        start = end - self._window
+        # Keep the last point before the window; it is the value at its start
+        while len(self._points) > 1 and self._points[1][0] <= start:
+            self._points.popleft()
+        if not self._points:
+            return
+
+        times = [max(time, start) for time, _ in self._points]
+        values = [value for _, value in self._points]
+        graph = scale_graph(downsample(times, values, start, end))
+        if graph == self._last_graph:
+            return
+        self._last_graph = graph
+        values, miny, maxy = graph
+        # The graph stays on the panel until the feed is unbound
+        await self._coordinator.async_add_message(
+            self._text,
+            repeat=MESSAGE_REPEAT_FOREVER,
+            id=self.message_id,
+            graph=values,
+            miny=miny,
+            maxy=maxy,
+        )
@@ -0,0 +1,118 @@
+"""Image platform for IKEA OBEGRÄNSAD LED Control."""
+from __future__ import annotations
+
+import asyncio
+import logging
+
+from homeassistant.components.image import ImageEntity
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN
+from .coordinator import IkeaLedCoordinator
+from .frame import Frame
+
+_LOGGER = logging.getLogger(__name__)
+
+# Shortest time in seconds between preview updates, so animations do not
+# write a new state for every frame
+MIN_UPDATE_INTERVAL = 1.0
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up the IKEA OBEGRÄNSAD LED image platform."""
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+
+    async_add_entities([IkeaLedDisplayImage(coordinator, entry)])
+
+
+class IkeaLedDisplayImage(CoordinatorEntity[IkeaLedCoordinator], ImageEntity):
+    """Preview of what the panel is currently displaying."""
+
+    _attr_content_type = "image/png"
+
+    def __init__(
+        self,
+        coordinator: IkeaLedCoordinator,
+        entry: ConfigEntry,
+    ) -> None:
+        """Initialize the image entity."""
+        # Follows the frames the coordinator mirrors; a plugin change means
+        # the panel draws something the integration did not send
+        CoordinatorEntity.__init__(self, coordinator, context=frozenset({"frame", "plugin"}))
+        ImageEntity.__init__(self, coordinator.hass)
+        self._entry = entry
+        self._attr_unique_id = f"{entry.entry_id}_display"
+        self._attr_name = "IKEA OBEGRÄNSAD Display"
+        self._attr_icon = "mdi:dots-grid"
+        self._frame: Frame | None = None
+        # Last encoded PNG and the digest of the frame it shows
+        self._png: bytes | None = None
+        self._png_digest: int | None = None
+        self._attr_image_last_updated = dt_util.utcnow()
+        self._last_write = 0.0
+        self._write_handle: asyncio.TimerHandle | None = None
+
+    @property
+    def device_info(self) -> DeviceInfo:
+        """Return device information."""
+        return DeviceInfo(
+            identifiers={(DOMAIN, self._entry.entry_id)},
+            name="IKEA OBEGRÄNSAD LED",
+            manufacturer="IKEA (Modified)",
+            model="OBEGRÄNSAD",
+            configuration_url=f"http://{self.coordinator.host}",
+        )
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Cancel a pending preview update."""
+        if self._write_handle is not None:
+            self._write_handle.cancel()
+            self._write_handle = None
+        await super().async_will_remove_from_hass()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Take the mirrored frame and write the state, at most once per interval."""
+        frame = self.coordinator.displayed_frame
+        if frame is None or self._frame is None or frame.digest != self._frame.digest:
+            self._frame = frame
+            self._attr_image_last_updated = dt_util.utcnow()
+        if self._write_handle is not None:
+            return
+        delay = self._last_write + MIN_UPDATE_INTERVAL - self.hass.loop.time()
+        if delay > 0:
+            self._write_handle = self.hass.loop.call_later(delay, self._async_write_update)
+            return
+        self._async_write_update()
+
+    @callback
+    def _async_write_update(self) -> None:
+        """Write the entity state."""
+        self._write_handle = None
+        self._last_write = self.hass.loop.time()
+        self.async_write_ha_state()
+
+    async def async_image(self) -> bytes | None:
+        """Return the current panel contents as PNG.
+
+        Frames sent by the integration are rendered from memory. While a
+        plugin or message draws, the render buffer is fetched once per
+        request instead of being polled. The PNG is only encoded again when
+        the frame changed.
+        """
+        frame = self._frame
+        if frame is None and (frame := await self.coordinator.async_get_frame()) is None:
+            return self._png
+        if frame.digest != self._png_digest:
+            self._png = frame.to_png()
+            self._png_digest = frame.digest
+        return self._png
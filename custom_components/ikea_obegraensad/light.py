@@ -42,7 +42,11 @@ class IkeaLedLight(CoordinatorEntity[IkeaLedCoordinator], LightEntity):
         entry: ConfigEntry,
     ) -> None:
         """Initialize the light."""
-        super().__init__(coordinator)
+        # Only re-render when a field shown in state or attributes changes
+        super().__init__(
+            coordinator,
+            context=frozenset({"brightness", "plugin", "plugins", "restored", "rotation", "schedule_active"}),
+        )
         self._entry = entry
         self._attr_unique_id = f"{entry.entry_id}_light"
         self._attr_name = "IKEA OBEGRÄNSAD LED"
@@ -66,14 +70,14 @@ class IkeaLedLight(CoordinatorEntity[IkeaLedCoordinator], LightEntity):
         """Return true if light is on."""
         if not self.coordinator.data:
             return False
-        return self.coordinator.data.get("brightness", 0) > 0
+        return self.coordinator.data.brightness > 0
 
     @property
     def brightness(self) -> int | None:
         """Return the brightness of this light between 0..255."""
         if not self.coordinator.data:
             return None
-        return self.coordinator.data.get("brightness", 0)
+        return self.coordinator.data.brightness
 
     @property
     def extra_state_attributes(self) -> dict[str, Any] | None:
@@ -83,36 +87,27 @@ class IkeaLedLight(CoordinatorEntity[IkeaLedCoordinator], LightEntity):
             
         data = self.coordinator.data
         return {
-            "plugin": data.get("plugin"),
-            "rotation": data.get("rotation"),
-            "schedule_active": data.get("scheduleActive"),
-            "available_plugins": [
-                f"{plugin.get('id')}: {plugin.get('name', 'Unknown')}"
-                for plugin in data.get("plugins", [])
-            ],
+            "plugin": data.plugin,
+            "rotation": data.rotation,
+            "schedule_active": data.schedule_active,
+            "available_plugins": self.coordinator.plugin_index.options,
+            # True while the state is restored from before a restart
+            "state_restored": self.coordinator.state_restored,
         }
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn on the light."""
         if ATTR_BRIGHTNESS in kwargs:
             brightness = kwargs[ATTR_BRIGHTNESS]
-            await self.hass.async_add_executor_job(
-                self.coordinator.set_brightness, brightness
-            )
+            ack = await self.coordinator.async_set_brightness(brightness)
         else:
             # Turn on with max brightness
-            await self.hass.async_add_executor_job(
-                self.coordinator.set_brightness, 255
-            )
+            ack = await self.coordinator.async_set_brightness(255)
         
-        # Gentle refresh to ensure UI updates
-        await self.coordinator.async_refresh_after_command()
+        await self.coordinator.async_wait_for_ack(ack)
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn off the light."""
-        await self.hass.async_add_executor_job(
-            self.coordinator.set_brightness, 0
-        )
+        ack = await self.coordinator.async_set_brightness(0)
         
-        # Gentle refresh to ensure UI updates  
-        await self.coordinator.async_refresh_after_command()
\ No newline at end of file
+        await self.coordinator.async_wait_for_ack(ack)
\ No newline at end of file
@@ -0,0 +1,190 @@
+"""Message mirror for IKEA OBEGRÄNSAD LED Control."""
+from __future__ import annotations
+
+import asyncio
+import logging
+
+from homeassistant.core import HomeAssistant, callback
+
+from .api import IkeaLedApiClient, IkeaLedApiError
+from .const import MESSAGE_AUTO_ID_MAX, MESSAGE_AUTO_ID_MIN
+from .frame import WIDTH
+
+_LOGGER = logging.getLogger(__name__)
+
+# Approximate width in columns of one character in the firmware font
+_CHAR_COLUMNS = 6
+
+
+class MessageRecord:
+    """A message this integration placed on a panel."""
+
+    __slots__ = ("id", "params", "digest", "expires", "persistent")
+
+    def __init__(
+        self, id: int, params: dict[str, str], expires: float | None, persistent: bool
+    ) -> None:
+        self.id = id
+        self.params = params
+        self.digest = _digest(params)
+        # Loop time after which the message is gone from the device
+        self.expires = expires
+        # Whether the message must be restored when the panel loses it
+        self.persistent = persistent
+
+
+def _digest(params: dict[str, str]) -> int:
+    """Return the content hash of a message, ignoring its id."""
+    return hash(tuple(sorted((key, value) for key, value in params.items() if key != "id")))
+
+
+def _display_time(text: str, repeat: int, delay: int, graph: bool) -> float:
+    """Estimate how many seconds the firmware takes to show a message repeat times."""
+    columns = len(text) * _CHAR_COLUMNS + WIDTH + (WIDTH if graph else 0)
+    return repeat * columns * delay / 1000
+
+
+class MessageManager:
+    """Keep a mirror of the messages placed on one panel.
+
+    Every message gets an explicit id (allocated from a reserved range when
+    the caller passes 0), so re-running an automation replaces its message
+    instead of adding another one. Endless and ttl messages stay on the panel
+    until removed, so uploading one the mirror already holds is skipped; they
+    are uploaded again after a reconnect, since the panel may have restarted
+    and lost them. Messages that repeat a fixed number of times may already
+    have finished, so they are always uploaded; their id is kept for the
+    estimated display time so identical messages replace each other.
+    """
+
+    def __init__(self, hass: HomeAssistant, api: IkeaLedApiClient) -> None:
+        """Initialize the manager."""
+        self.hass = hass
+        self._api = api
+        self._records: dict[int, MessageRecord] = {}
+        self._expiry_timers: dict[int, asyncio.TimerHandle] = {}
+        self.uploads_skipped = 0
+
+    @property
+    def messages(self) -> dict[int, dict[str, str]]:
+        """Return the mirrored messages by id."""
+        self._prune()
+        return {id: record.params for id, record in self._records.items()}
+
+    def _prune(self) -> None:
+        """Forget messages that have expired."""
+        now = self.hass.loop.time()
+        for id in [id for id, r in self._records.items() if r.expires is not None and r.expires <= now]:
+            del self._records[id]
+
+    def _allocate_id(self) -> int:
+        """Return the lowest free id of the reserved range."""
+        for id in range(MESSAGE_AUTO_ID_MIN, MESSAGE_AUTO_ID_MAX + 1):
+            if id not in self._records:
+                return id
+        raise IkeaLedApiError("No free message id left")
+
+    async def async_add(
+        self,
+        text: str,
+        repeat: int = 1,
+        id: int = 0,
+        delay: int = 50,
+        graph: list | None = None,
+        miny: int = 0,
+        maxy: int = 15,
+        ttl: float | None = None,
+    ) -> int:
+        """Place a message on the panel unless it is already there.
+
+        Returns the message id. Raises IkeaLedApiError when the upload fails.
+        """
+        self._prune()
+        params = {
+            "text": text,
+            "repeat": str(repeat),
+            "delay": str(delay),
+            "miny": str(miny),
+            "maxy": str(maxy),
+        }
+        if graph:
+            params["graph"] = ",".join(str(x) for x in graph)
+        digest = _digest(params)
+        if not id:
+            id = next(
+                (r.id for r in self._records.values() if r.digest == digest and r.id >= MESSAGE_AUTO_ID_MIN),
+                None,
+            ) or self._allocate_id()
+        params["id"] = str(id)
+
+        record = self._records.get(id)
+        on_panel = record is not None and record.persistent and record.digest == digest
+        if on_panel and not ttl:
+            self.uploads_skipped += 1
+            _LOGGER.debug("Message %s on %s is unchanged, not uploading", id, self._api.host)
+            return id
+
+        now = self.hass.loop.time()
+        if ttl:
+            expires = now + ttl
+        elif repeat > 0:
+            expires = now + _display_time(text, repeat, delay, bool(graph))
+        else:
+            expires = None
+        if on_panel:
+            # Only the ttl is renewed
+            self.uploads_skipped += 1
+        else:
+            # The id is explicit, so retrying cannot duplicate the message
+            await self._api.async_request("GET", "message", params=params)
+        self._records[id] = MessageRecord(id, params, expires, repeat <= 0 or bool(ttl))
+        self._async_schedule_removal(id, ttl)
+        return id
+
+    async def async_remove(self, id: int) -> None:
+        """Remove a message from the panel and the mirror."""
+        self._records.pop(id, None)
+        self._async_schedule_removal(id, None)
+        await self._api.async_request("GET", "removemessage", params={"id": str(id)})
+
+    @callback
+    def _async_schedule_removal(self, id: int, ttl: float | None) -> None:
+        """Replace the expiry timer of a message."""
+        if (timer := self._expiry_timers.pop(id, None)) is not None:
+            timer.cancel()
+        if ttl:
+            self._expiry_timers[id] = self.hass.loop.call_later(
+                ttl,
+                lambda: self.hass.async_create_task(self._async_expire(id)),
+            )
+
+    async def _async_expire(self, id: int) -> None:
+        """Remove a message whose ttl has passed."""
+        self._expiry_timers.pop(id, None)
+        try:
+            await self.async_remove(id)
+        except IkeaLedApiError as ex:
+            _LOGGER.debug("Failed to remove expired message %s from %s: %s", id, self._api.host, ex)
+
+    async def async_reconcile(self) -> None:
+        """Upload the mirrored messages that must survive a panel restart."""
+        self._prune()
+        restored = 0
+        for record in list(self._records.values()):
+            if not record.persistent:
+                continue
+            try:
+                await self._api.async_request("GET", "message", params=record.params)
+            except IkeaLedApiError as ex:
+                _LOGGER.debug("Failed to restore message %s on %s: %s", record.id, self._api.host, ex)
+                return
+            restored += 1
+        if restored:
+            _LOGGER.debug("Restored %s messages on %s", restored, self._api.host)
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Cancel expiry timers."""
+        for timer in self._expiry_timers.values():
+            timer.cancel()
+        self._expiry_timers.clear()
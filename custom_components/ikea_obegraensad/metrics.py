@@ -0,0 +1,145 @@
+"""Performance counters for IKEA OBEGRÄNSAD LED Control."""
+from __future__ import annotations
+
+from bisect import bisect_left
+from typing import Any
+
+# Upper bounds of the latency histogram buckets, in milliseconds
+LATENCY_BUCKETS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000)
+# Seconds covered by a rate counter
+RATE_WINDOW = 60
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram with percentile estimates.
+
+    Recording is O(log buckets) and memory is constant, so it can sit on the
+    WebSocket receive path. Percentiles are interpolated within a bucket.
+    """
+
+    __slots__ = ("counts", "count", "total", "max")
+
+    def __init__(self) -> None:
+        self.counts = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, seconds: float) -> None:
+        """Record one duration."""
+        ms = seconds * 1000
+        self.counts[bisect_left(LATENCY_BUCKETS_MS, ms)] += 1
+        self.count += 1
+        self.total += ms
+        self.max = max(self.max, ms)
+
+    def percentile(self, q: float) -> float | None:
+        """Return the estimated q-th percentile (0-1) in milliseconds."""
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for index, bucket in enumerate(self.counts):
+            if bucket and seen + bucket >= rank:
+                if index == len(LATENCY_BUCKETS_MS):
+                    return round(self.max, 1)
+                low = LATENCY_BUCKETS_MS[index - 1] if index else 0.0
+                high = min(LATENCY_BUCKETS_MS[index], self.max)
+                return round(low + (high - low) * (rank - seen) / bucket, 1)
+            seen += bucket
+        return round(self.max, 1)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a summary in milliseconds."""
+        return {
+            "count": self.count,
+            "avg_ms": round(self.total / self.count, 1) if self.count else None,
+            "p50_ms": self.percentile(0.5),
+            "p95_ms": self.percentile(0.95),
+            "max_ms": round(self.max, 1),
+        }
+
+
+class RateCounter:
+    """Count events and their rate over the last RATE_WINDOW seconds."""
+
+    __slots__ = ("total", "_buckets", "_seconds")
+
+    def __init__(self) -> None:
+        self.total = 0
+        self._buckets = [0] * RATE_WINDOW
+        self._seconds = [-1] * RATE_WINDOW
+
+    def record(self, now: float) -> None:
+        """Count one event at loop time now."""
+        second = int(now)
+        index = second % RATE_WINDOW
+        if self._seconds[index] != second:
+            self._seconds[index] = second
+            self._buckets[index] = 0
+        self._buckets[index] += 1
+        self.total += 1
+
+    def per_minute(self, now: float) -> int:
+        """Return the number of events in the last RATE_WINDOW seconds."""
+        second = int(now)
+        return sum(
+            count
+            for count, stamp in zip(self._buckets, self._seconds)
+            if second - stamp < RATE_WINDOW
+        )
+
+
+class RequestStats:
+    """Timing and error counters for HTTP requests."""
+
+    __slots__ = ("errors", "retries", "latency")
+
+    def __init__(self) -> None:
+        self.errors = 0
+        self.retries = 0
+        self.latency = LatencyHistogram()
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the counters with durations in milliseconds."""
+        return {"errors": self.errors, "retries": self.retries, **self.latency.as_dict()}
+
+
+class PanelMetrics:
+    """Counters and histograms for one panel connection."""
+
+    def __init__(self) -> None:
+        """Initialize the counters."""
+        self.ws_received = RateCounter()
+        # Payload keys the decoder does not know, with how often they arrived
+        self.ws_unknown_keys: dict[str, int] = {}
+        self.ws_sent = 0
+        self.reconnects = 0
+        self.command_rtt = LatencyHistogram()
+        self.ack_timeouts = 0
+        # Deepest the outbound queue has been, overall and since the last read
+        self.queue_depth_max = 0
+        self.queue_depth_peak = 0
+
+    def record_queue_depth(self, depth: int) -> None:
+        """Record the outbound queue depth seen by the writer."""
+        self.queue_depth_max = max(self.queue_depth_max, depth)
+        self.queue_depth_peak = max(self.queue_depth_peak, depth)
+
+    def take_queue_depth_peak(self) -> int:
+        """Return the deepest queue since the last call and reset it."""
+        peak, self.queue_depth_peak = self.queue_depth_peak, 0
+        return peak
+
+    def as_dict(self, now: float) -> dict[str, Any]:
+        """Return all counters."""
+        return {
+            "ws_received": self.ws_received.total,
+            "ws_received_per_minute": self.ws_received.per_minute(now),
+            "ws_unknown_keys": dict(self.ws_unknown_keys),
+            "ws_sent": self.ws_sent,
+            "reconnects": self.reconnects,
+            "command_rtt": self.command_rtt.as_dict(),
+            "ack_timeouts": self.ack_timeouts,
+            "queue_depth_max": self.queue_depth_max,
+        }
@@ -0,0 +1,129 @@
+"""Data models for IKEA OBEGRÄNSAD LED Control."""
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+from types import MappingProxyType
+from typing import Any
+
+
+class PluginIndex:
+    """Lookup tables derived from the device's plugin catalogue.
+
+    Built once whenever the ``plugins`` payload changes so entities can read
+    names, select options and attribute payloads without scanning the list.
+    The cached lists are shared between entities and must not be mutated.
+    """
+
+    __slots__ = ("names", "ids_by_option", "options", "options_by_id", "attribute_plugins")
+
+    def __init__(self, plugins: Sequence[Mapping[str, Any]]) -> None:
+        """Index the plugin list reported by the device."""
+        self.names: dict[Any, str | None] = {}
+        self.ids_by_option: dict[str, Any] = {}
+        self.options: list[str] = []
+        self.options_by_id: dict[Any, str] = {}
+        # [{"id": ..., "name": ...}] as exposed by the active plugin sensor
+        self.attribute_plugins: list[dict[str, Any]] = []
+
+        for plugin in plugins:
+            if not isinstance(plugin, Mapping):
+                continue
+            plugin_id = plugin.get("id")
+            name = plugin.get("name", "Unknown")
+            option = f"{plugin_id}: {name}"
+            self.names.setdefault(plugin_id, plugin.get("name"))
+            self.ids_by_option[option] = plugin_id
+            self.options_by_id.setdefault(plugin_id, option)
+            self.options.append(option)
+            self.attribute_plugins.append({"id": plugin_id, "name": name})
+
+    def name(self, plugin_id: Any) -> str:
+        """Return the display name of a plugin, falling back to its id."""
+        name = self.names.get(plugin_id)
+        return name if name is not None else f"Plugin {plugin_id}"
+
+
+def freeze(value: Any) -> Any:
+    """Return a read-only copy of value that can be shared between snapshots.
+
+    Lists become tuples and dicts read-only mappings, recursively.
+    """
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    if isinstance(value, Mapping):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    return value
+
+
+def thaw(value: Any) -> Any:
+    """Return a mutable, JSON serialisable copy of a frozen value."""
+    if isinstance(value, tuple):
+        return [thaw(item) for item in value]
+    if isinstance(value, Mapping):
+        return {key: thaw(item) for key, item in value.items()}
+    return value
+
+
+class DeviceState:
+    """Immutable snapshot of the state reported by a panel.
+
+    Changes never modify a snapshot: evolve() returns a new one with a higher
+    version that shares every unchanged value with its predecessor, so
+    entities can keep a reference to the snapshot they rendered instead of
+    copying it. Values must be passed through freeze() first, so nested
+    lists and dicts cannot be changed either.
+    """
+
+    __slots__ = (
+        "version",
+        "brightness",
+        "rotation",
+        "plugin",
+        "persist_plugin",
+        "schedule_active",
+        "schedule",
+        "plugins",
+    )
+    FIELDS = __slots__[1:]
+
+    def __init__(
+        self,
+        version: int = 0,
+        brightness: int = 0,
+        rotation: int = 0,
+        plugin: Any = None,
+        persist_plugin: Any = None,
+        schedule_active: bool = False,
+        schedule: tuple[Any, ...] = (),
+        plugins: tuple[Mapping[str, Any], ...] = (),
+    ) -> None:
+        """Initialize the snapshot."""
+        setter = object.__setattr__
+        setter(self, "version", version)
+        setter(self, "brightness", brightness)
+        setter(self, "rotation", rotation)
+        setter(self, "plugin", plugin)
+        setter(self, "persist_plugin", persist_plugin)
+        setter(self, "schedule_active", schedule_active)
+        setter(self, "schedule", schedule)
+        setter(self, "plugins", plugins)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError("DeviceState is immutable, use evolve()")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError("DeviceState is immutable, use evolve()")
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"DeviceState({fields})"
+
+    def evolve(self, **changes: Any) -> DeviceState:
+        """Return the next snapshot with the given fields replaced."""
+        values = {name: getattr(self, name) for name in self.FIELDS}
+        values.update(changes)
+        return DeviceState(self.version + 1, **values)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the fields as plain dicts and lists, e.g. for diagnostics or storage."""
+        return {name: thaw(getattr(self, name)) for name in self.FIELDS}
@@ -0,0 +1,126 @@
+"""Plugin schedule model for IKEA OBEGRÄNSAD LED Control."""
+from __future__ import annotations
+
+from collections.abc import Mapping
+from datetime import datetime, timedelta
+import json
+from typing import Any, NamedTuple
+
+from .models import PluginIndex
+
+# Longest duration of a single schedule entry, in seconds
+MAX_ENTRY_DURATION = 86400
+
+
+class ScheduleEntry(NamedTuple):
+    """One step of a schedule: show a plugin for duration seconds."""
+
+    plugin_id: int
+    duration: int
+
+
+def _as_int(value: Any) -> int:
+    """Return value as an int, rejecting fractions such as 1.9."""
+    if isinstance(value, bool):
+        raise ValueError(f"{value} is not a number")
+    if isinstance(value, float):
+        if not value.is_integer():
+            raise ValueError(f"{value} is not a whole number")
+        return int(value)
+    if isinstance(value, (int, str)):
+        return int(value)
+    raise ValueError(f"{value!r} is not a number")
+
+
+def parse_schedule(value: Any) -> list[tuple[int | str, int]]:
+    """Check the structure of a schedule given to a service.
+
+    Accepts a JSON string or a list of mappings with ``pluginId`` (or
+    ``plugin``, an id or plugin name) and ``duration`` in seconds. Returns
+    (plugin, duration) pairs where plugin is an id or a name still to be
+    resolved. Raises ValueError describing the first invalid entry.
+    """
+    if isinstance(value, str):
+        try:
+            value = json.loads(value)
+        except ValueError as ex:
+            raise ValueError(f"Schedule is not valid JSON: {ex}") from ex
+    if not isinstance(value, (list, tuple)):
+        raise ValueError("Schedule must be a list of entries")
+
+    items = []
+    for position, item in enumerate(value, start=1):
+        if not isinstance(item, Mapping):
+            raise ValueError(f"Schedule entry {position} must be a mapping")
+        plugin = item.get("pluginId", item.get("plugin"))
+        try:
+            duration = _as_int(item.get("duration"))
+            if not isinstance(plugin, str) or plugin.strip().lstrip("-").isdigit():
+                plugin = _as_int(plugin)
+        except ValueError as ex:
+            raise ValueError(f"Schedule entry {position} needs a pluginId and a duration: {ex}") from ex
+        if not 1 <= duration <= MAX_ENTRY_DURATION:
+            raise ValueError(
+                f"Schedule entry {position}: duration must be 1-{MAX_ENTRY_DURATION} seconds"
+            )
+        items.append((plugin, duration))
+    return items
+
+
+def compile_schedule(value: Any, plugins: PluginIndex | None = None) -> tuple[ScheduleEntry, ...]:
+    """Validate a schedule and resolve plugin names to ids.
+
+    Names are looked up in the device's plugin catalogue; when it is known,
+    unknown plugin ids are rejected as well. Raises ValueError describing
+    the first invalid entry.
+    """
+    ids_by_name = {}
+    if plugins is not None:
+        ids_by_name = {
+            name.casefold(): plugin_id for plugin_id, name in plugins.names.items() if name
+        }
+    entries = []
+    for position, (plugin, duration) in enumerate(parse_schedule(value), start=1):
+        if isinstance(plugin, str):
+            if (plugin_id := ids_by_name.get(plugin.casefold())) is None:
+                raise ValueError(f"Schedule entry {position}: unknown plugin {plugin}")
+        else:
+            plugin_id = plugin
+        if plugins is not None and plugins.names and plugin_id not in plugins.names:
+            raise ValueError(f"Schedule entry {position}: unknown plugin {plugin}")
+        entries.append(ScheduleEntry(plugin_id, duration))
+    return tuple(entries)
+
+
+def device_schedule(value: Any) -> tuple[ScheduleEntry, ...] | None:
+    """Normalise the schedule reported by the device, or None if unreadable."""
+    try:
+        return compile_schedule(value)
+    except ValueError:
+        return None
+
+
+def schedule_payload(entries: tuple[ScheduleEntry, ...]) -> str:
+    """Return the JSON the firmware expects for a schedule."""
+    return json.dumps(
+        [{"pluginId": entry.plugin_id, "duration": entry.duration} for entry in entries],
+        separators=(",", ":"),
+    )
+
+
+def next_transition(
+    entries: tuple[ScheduleEntry, ...], plugin_id: Any, since: datetime | None
+) -> tuple[ScheduleEntry, datetime] | None:
+    """Return the entry the schedule switches to next and when.
+
+    The firmware does not report its position in the schedule, so it is
+    taken from the active plugin and the time that plugin became active.
+    Returns None when the schedule is empty or the active plugin is not part
+    of it.
+    """
+    if not entries or since is None:
+        return None
+    for index, entry in enumerate(entries):
+        if entry.plugin_id == plugin_id:
+            return entries[(index + 1) % len(entries)], since + timedelta(seconds=entry.duration)
+    return None
@@ -37,7 +37,7 @@ class IkeaLedPluginSelect(CoordinatorEntity[IkeaLedCoordinator], SelectEntity):
         entry: ConfigEntry,
     ) -> None:
         """Initialize the select entity."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=frozenset({"plugin", "plugins"}))
         self._entry = entry
         self._attr_unique_id = f"{entry.entry_id}_plugin_select"
         self._attr_name = "IKEA OBEGRÄNSAD Plugin"
@@ -57,13 +57,10 @@ class IkeaLedPluginSelect(CoordinatorEntity[IkeaLedCoordinator], SelectEntity):
     @property
     def options(self) -> list[str]:
         """Return a list of selectable options."""
-        if not self.coordinator.data or "plugins" not in self.coordinator.data:
+        if not self.coordinator.data:
             return []
         
-        return [
-            f"{plugin.get('id')}: {plugin.get('name', 'Unknown')}"
-            for plugin in self.coordinator.data["plugins"]
-        ]
+        return self.coordinator.plugin_index.options
 
     @property
     def current_option(self) -> str | None:
@@ -71,30 +68,23 @@ class IkeaLedPluginSelect(CoordinatorEntity[IkeaLedCoordinator], SelectEntity):
         if not self.coordinator.data:
             return None
             
-        current_plugin_id = self.coordinator.data.get("plugin")
+        current_plugin_id = self.coordinator.data.plugin
         if current_plugin_id is None:
             return None
             
-        # Find the matching plugin name
-        plugins = self.coordinator.data.get("plugins", [])
-        for plugin in plugins:
-            if plugin.get("id") == current_plugin_id:
-                return f"{plugin.get('id')}: {plugin.get('name', 'Unknown')}"
-                
-        return None
+        return self.coordinator.plugin_index.options_by_id.get(current_plugin_id)
 
     async def async_select_option(self, option: str) -> None:
         """Change the selected option."""
-        # Extract plugin ID from the option string (format: "ID: Name")
+        # Look up the plugin ID, falling back to parsing "ID: Name"
         try:
-            plugin_id = int(option.split(":")[0].strip())
+            plugin_id = self.coordinator.plugin_index.ids_by_option.get(option)
+            if plugin_id is None:
+                plugin_id = int(option.split(":")[0].strip())
             
-            await self.hass.async_add_executor_job(
-                self.coordinator.set_plugin, plugin_id
-            )
+            ack = await self.coordinator.async_set_plugin(plugin_id)
             
-            # Gentle refresh to ensure UI updates
-            await self.coordinator.async_refresh_after_command()
+            await self.coordinator.async_wait_for_ack(ack)
             
         except (ValueError, IndexError) as ex:
             _LOGGER.error("Failed to parse plugin ID from option: %s", option)
@@ -1,6 +1,8 @@
 """Sensor platform for IKEA OBEGRÄNSAD LED Control."""
 from __future__ import annotations
 
+from collections.abc import Callable
+from datetime import timedelta
 import logging
 from typing import Any
 
@@ -10,6 +12,7 @@ from homeassistant.components.sensor import (
     SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import EntityCategory, UnitOfTime
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
@@ -17,9 +20,13 @@ from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
 from .coordinator import IkeaLedCoordinator
+from .models import thaw
 
 _LOGGER = logging.getLogger(__name__)
 
+# Poll interval of the diagnostic metric sensors
+SCAN_INTERVAL = timedelta(seconds=30)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -34,6 +41,41 @@ async def async_setup_entry(
         IkeaLedActivePluginSensor(coordinator, entry),
         IkeaLedScheduleStatusSensor(coordinator, entry),
         IkeaLedBrightnessSensor(coordinator, entry),
+        IkeaLedMetricSensor(
+            coordinator, entry, "ws_messages_per_minute", "WebSocket Messages",
+            "mdi:swap-vertical", "msg/min", SensorStateClass.MEASUREMENT,
+            lambda c: c.metrics.ws_received.per_minute(c.hass.loop.time()),
+        ),
+        IkeaLedMetricSensor(
+            coordinator, entry, "command_rtt_p50", "Command RTT p50",
+            "mdi:timer-outline", UnitOfTime.MILLISECONDS, SensorStateClass.MEASUREMENT,
+            lambda c: c.metrics.command_rtt.percentile(0.5),
+        ),
+        IkeaLedMetricSensor(
+            coordinator, entry, "command_rtt_p95", "Command RTT p95",
+            "mdi:timer-alert-outline", UnitOfTime.MILLISECONDS, SensorStateClass.MEASUREMENT,
+            lambda c: c.metrics.command_rtt.percentile(0.95),
+        ),
+        IkeaLedMetricSensor(
+            coordinator, entry, "reconnects", "Reconnects",
+            "mdi:connection", None, SensorStateClass.TOTAL_INCREASING,
+            lambda c: c.metrics.reconnects,
+        ),
+        IkeaLedMetricSensor(
+            coordinator, entry, "queue_depth", "Outbound Queue Peak",
+            "mdi:tray-full", None, SensorStateClass.MEASUREMENT,
+            lambda c: c.metrics.take_queue_depth_peak(),
+        ),
+        IkeaLedMetricSensor(
+            coordinator, entry, "http_p95", "HTTP Latency p95",
+            "mdi:web-clock", UnitOfTime.MILLISECONDS, SensorStateClass.MEASUREMENT,
+            lambda c: c.api.totals.latency.percentile(0.95),
+        ),
+        IkeaLedMetricSensor(
+            coordinator, entry, "http_errors", "HTTP Errors",
+            "mdi:web-remove", None, SensorStateClass.TOTAL_INCREASING,
+            lambda c: c.api.totals.errors,
+        ),
     ]
     
     async_add_entities(sensors)
@@ -49,9 +91,14 @@ class IkeaLedBaseSensor(CoordinatorEntity[IkeaLedCoordinator], SensorEntity):
         sensor_type: str,
         name: str,
         icon: str | None = None,
+        fields: frozenset[str] | None = None,
     ) -> None:
-        """Initialize the sensor."""
-        super().__init__(coordinator)
+        """Initialize the sensor.
+
+        fields lists the coordinator state keys this sensor renders; the
+        sensor is only updated when one of them changes.
+        """
+        super().__init__(coordinator, context=fields)
         self._entry = entry
         self._sensor_type = sensor_type
         self._attr_unique_id = f"{entry.entry_id}_{sensor_type}"
@@ -81,7 +128,8 @@ class IkeaLedRotationSensor(IkeaLedBaseSensor):
             entry, 
             "rotation", 
             "Rotation",
-            "mdi:rotate-3d-variant"
+            "mdi:rotate-3d-variant",
+            frozenset({"rotation"}),
         )
         self._attr_state_class = SensorStateClass.MEASUREMENT
 
@@ -90,7 +138,7 @@ class IkeaLedRotationSensor(IkeaLedBaseSensor):
         """Return the current rotation value."""
         if not self.coordinator.data:
             return None
-        return (90 * self.coordinator.data.get("rotation")) % 360
+        return (90 * self.coordinator.data.rotation) % 360
 
     @property
     def native_unit_of_measurement(self) -> str:
@@ -108,7 +156,8 @@ class IkeaLedActivePluginSensor(IkeaLedBaseSensor):
             entry,
             "active_plugin",
             "Active Plugin",
-            "mdi:puzzle"
+            "mdi:puzzle",
+            frozenset({"plugin", "plugins", "persist_plugin"}),
         )
 
     @property
@@ -117,17 +166,11 @@ class IkeaLedActivePluginSensor(IkeaLedBaseSensor):
         if not self.coordinator.data:
             return None
             
-        plugin_id = self.coordinator.data.get("plugin")
+        plugin_id = self.coordinator.data.plugin
         if plugin_id is None:
             return None
             
-        # Find the plugin name from available plugins
-        plugins = self.coordinator.data.get("plugins", [])
-        for plugin in plugins:
-            if plugin.get("id") == plugin_id:
-                return plugin.get("name", f"Plugin {plugin_id}")
-                
-        return f"Plugin {plugin_id}"
+        return self.coordinator.plugin_index.name(plugin_id)
 
     @property
     def extra_state_attributes(self) -> dict[str, Any] | None:
@@ -135,15 +178,12 @@ class IkeaLedActivePluginSensor(IkeaLedBaseSensor):
         if not self.coordinator.data:
             return None
         attrs = {
-            "plugin_id": self.coordinator.data.get("plugin"),
-            "available_plugins": [
-                {"id": plugin.get("id"), "name": plugin.get("name", "Unknown")}
-                for plugin in self.coordinator.data.get("plugins", [])
-            ],
+            "plugin_id": self.coordinator.data.plugin,
+            "available_plugins": self.coordinator.plugin_index.attribute_plugins,
         }
 
         # Include persisted plugin id if the device reports it
-        persisted = self.coordinator.data.get("persistPlugin")
+        persisted = self.coordinator.data.persist_plugin
         if persisted is not None:
             attrs["persisted_plugin_id"] = persisted
 
@@ -160,7 +200,8 @@ class IkeaLedScheduleStatusSensor(IkeaLedBaseSensor):
             entry,
             "schedule_status",
             "Schedule Status",
-            "mdi:calendar-clock"
+            "mdi:calendar-clock",
+            frozenset({"schedule_active", "schedule"}),
         )
         self._attr_device_class = SensorDeviceClass.ENUM
         self._attr_options = ["active", "inactive"]
@@ -171,7 +212,7 @@ class IkeaLedScheduleStatusSensor(IkeaLedBaseSensor):
         if not self.coordinator.data:
             return None
             
-        schedule_active = self.coordinator.data.get("scheduleActive", False)
+        schedule_active = self.coordinator.data.schedule_active
         return "active" if schedule_active else "inactive"
 
     @property
@@ -181,7 +222,7 @@ class IkeaLedScheduleStatusSensor(IkeaLedBaseSensor):
             return None
             
         return {
-            "schedule": self.coordinator.data.get("schedule", [])
+            "schedule": thaw(self.coordinator.data.schedule)
         }
 
 
@@ -195,7 +236,8 @@ class IkeaLedBrightnessSensor(IkeaLedBaseSensor):
             entry,
             "brightness",
             "Brightness",
-            "mdi:brightness-6"
+            "mdi:brightness-6",
+            frozenset({"brightness"}),
         )
         self._attr_state_class = SensorStateClass.MEASUREMENT
 
@@ -204,7 +246,7 @@ class IkeaLedBrightnessSensor(IkeaLedBaseSensor):
         """Return the current brightness value."""
         if not self.coordinator.data:
             return None
-        brightness_raw = self.coordinator.data.get("brightness")
+        brightness_raw = self.coordinator.data.brightness
         return round((brightness_raw / 255) * 100, 1)
 
     @property
@@ -218,8 +260,46 @@ class IkeaLedBrightnessSensor(IkeaLedBaseSensor):
         if not self.coordinator.data:
             return None
             
-        brightness = self.coordinator.data.get("brightness", 0)
+        brightness = self.coordinator.data.brightness
         return {
             "brightness_percent": round((brightness / 255) * 100, 1),
             "brightness_raw": brightness,
-        }
\ No newline at end of file
+        }
+
+
+class IkeaLedMetricSensor(IkeaLedBaseSensor):
+    """Diagnostic sensor for a connection metric.
+
+    Metrics change with every message, so instead of following coordinator
+    updates these sensors are polled every SCAN_INTERVAL. They are disabled
+    by default.
+    """
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+
+    def __init__(
+        self,
+        coordinator: IkeaLedCoordinator,
+        entry: ConfigEntry,
+        sensor_type: str,
+        name: str,
+        icon: str,
+        unit: str | None,
+        state_class: SensorStateClass,
+        value_fn: Callable[[IkeaLedCoordinator], Any],
+    ) -> None:
+        """Initialize the metric sensor."""
+        super().__init__(coordinator, entry, sensor_type, name, icon, frozenset())
+        self._attr_native_unit_of_measurement = unit
+        self._attr_state_class = state_class
+        self._value_fn = value_fn
+
+    @property
+    def should_poll(self) -> bool:
+        """Poll for new metric values."""
+        return True
+
+    async def async_update(self) -> None:
+        """Read the metric (without refreshing the coordinator)."""
+        self._attr_native_value = self._value_fn(self.coordinator)
@@ -0,0 +1,91 @@
+"""Render buffer snapshot store for IKEA OBEGRÄNSAD LED Control."""
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+import logging
+import os
+import re
+
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    DEFAULT_SNAPSHOT_MAX_AGE,
+    DEFAULT_SNAPSHOT_MAX_BYTES,
+    DEFAULT_SNAPSHOTS_PER_HOST,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+SNAPSHOT_SUFFIX = ".bin"
+_UNSAFE_CHARS = re.compile(r"[^A-Za-z0-9.-]")
+
+
+class SnapshotStore:
+    """Write render buffer snapshots to disk as a bounded ring.
+
+    Files are named ``<host>_<UTC timestamp>.bin``. After each write the
+    oldest files are evicted so every host keeps at most a fixed number of
+    snapshots, nothing is older than the maximum age and the directory stays
+    under a total size limit. All file I/O runs in the executor.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        directory: str,
+        per_host: int = DEFAULT_SNAPSHOTS_PER_HOST,
+        max_age: timedelta = DEFAULT_SNAPSHOT_MAX_AGE,
+        max_bytes: int = DEFAULT_SNAPSHOT_MAX_BYTES,
+    ) -> None:
+        """Initialize the store."""
+        self.hass = hass
+        self.directory = directory
+        self._per_host = per_host
+        self._max_age = max_age
+        self._max_bytes = max_bytes
+
+    async def async_save(self, snapshots: dict[str, bytes]) -> list[str]:
+        """Write one snapshot per host in a single executor job.
+
+        Returns the paths written.
+        """
+        return await self.hass.async_add_executor_job(self._save, snapshots, dt_util.utcnow())
+
+    def _save(self, snapshots: dict[str, bytes], now: datetime) -> list[str]:
+        """Write snapshots and evict old ones (runs in the executor)."""
+        os.makedirs(self.directory, exist_ok=True)
+        stamp = now.strftime("%Y%m%dT%H%M%S%fZ")
+        paths = []
+        for host, data in snapshots.items():
+            path = os.path.join(self.directory, f"{_UNSAFE_CHARS.sub('_', host)}_{stamp}{SNAPSHOT_SUFFIX}")
+            with open(path, "wb") as file:
+                file.write(data)
+            paths.append(path)
+        self._evict(now.timestamp())
+        return paths
+
+    def _evict(self, now: float) -> None:
+        """Remove snapshots beyond the age, per-host count and size limits."""
+        entries = []
+        for entry in os.scandir(self.directory):
+            if entry.is_file() and entry.name.endswith(SNAPSHOT_SUFFIX):
+                stat = entry.stat()
+                entries.append((stat.st_mtime, stat.st_size, entry.name, entry.path))
+        # Newest first, so everything past a limit is the oldest
+        entries.sort(reverse=True)
+
+        keep_after = now - self._max_age.total_seconds()
+        per_host: dict[str, int] = {}
+        total = 0
+        for mtime, size, name, path in entries:
+            host = name.rsplit("_", 1)[0]
+            per_host[host] = per_host.get(host, 0) + 1
+            total += size
+            if mtime >= keep_after and per_host[host] <= self._per_host and total <= self._max_bytes:
+                continue
+            try:
+                os.remove(path)
+            except OSError as ex:
+                _LOGGER.debug("Failed to remove snapshot %s: %s", path, ex)
+            total -= size
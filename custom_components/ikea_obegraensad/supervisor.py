@@ -0,0 +1,110 @@
+"""Shared connection supervisor for IKEA OBEGRÄNSAD LED panels."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+import logging
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import (
+    DATA_SUPERVISOR,
+    DEFAULT_MAX_CONCURRENT_CONNECTS,
+    DEFAULT_STARTUP_STAGGER,
+    DOMAIN,
+)
+
+if TYPE_CHECKING:
+    from .coordinator import IkeaLedCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class IkeaLedSupervisor:
+    """Own the WebSocket connections of every configured panel.
+
+    A single instance per Home Assistant bounds how many panels may be in a
+    connect/handshake at once, staggers connection start-up so a restart
+    does not hit the Wi-Fi AP with every panel at the same moment, and
+    reports aggregate health for the whole fleet.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        max_concurrent_connects: int = DEFAULT_MAX_CONCURRENT_CONNECTS,
+        startup_stagger: float = DEFAULT_STARTUP_STAGGER,
+    ) -> None:
+        """Initialize the supervisor."""
+        self.hass = hass
+        self._connect_slots = asyncio.Semaphore(max_concurrent_connects)
+        self._connecting = 0
+        self._startup_stagger = startup_stagger
+        # Loop time at which the next panel may start connecting
+        self._next_start = 0.0
+        self._coordinators: dict[str, IkeaLedCoordinator] = {}
+        self._tasks: dict[str, asyncio.Task] = {}
+
+    @callback
+    def async_add(self, entry_id: str, coordinator: IkeaLedCoordinator) -> None:
+        """Start supervising the connection of a panel."""
+        if entry_id in self._tasks:
+            return
+        now = self.hass.loop.time()
+        start = max(now, self._next_start)
+        self._next_start = start + self._startup_stagger
+        self._coordinators[entry_id] = coordinator
+        self._tasks[entry_id] = self.hass.async_create_background_task(
+            self._async_run(coordinator, start - now),
+            f"{DOMAIN} websocket {coordinator.host}",
+        )
+
+    async def _async_run(self, coordinator: IkeaLedCoordinator, delay: float) -> None:
+        """Run a panel's connection loop after its start-up delay."""
+        if delay > 0:
+            await asyncio.sleep(delay)
+        await coordinator.async_run_connection()
+
+    @asynccontextmanager
+    async def connect_slot(self) -> AsyncIterator[None]:
+        """Hold one of the limited connect/handshake slots."""
+        async with self._connect_slots:
+            self._connecting += 1
+            try:
+                yield
+            finally:
+                self._connecting -= 1
+
+    async def async_remove(self, entry_id: str) -> None:
+        """Stop supervising a panel and wait for its connection to close."""
+        self._coordinators.pop(entry_id, None)
+        task = self._tasks.pop(entry_id, None)
+        if task is None:
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    @callback
+    def async_health(self) -> dict[str, Any]:
+        """Return aggregate connection health for all supervised panels."""
+        coordinators = self._coordinators.values()
+        return {
+            "panels": len(self._coordinators),
+            "connected": sum(1 for c in coordinators if c.ws_connected),
+            "unavailable": sum(1 for c in coordinators if not c.last_update_success),
+            "reconnecting": sum(1 for c in coordinators if c.reconnect_attempt > 0),
+            "connecting": self._connecting,
+        }
+
+
+@callback
+def async_get_supervisor(hass: HomeAssistant) -> IkeaLedSupervisor:
+    """Return the shared supervisor, creating it on first use."""
+    if (supervisor := hass.data.get(DATA_SUPERVISOR)) is None:
+        supervisor = hass.data[DATA_SUPERVISOR] = IkeaLedSupervisor(hass)
+    return supervisor
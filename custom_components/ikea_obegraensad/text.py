@@ -0,0 +1,162 @@
+"""Bitmap text rendering for IKEA OBEGRÄNSAD LED Control."""
+from __future__ import annotations
+
+from functools import lru_cache
+import unicodedata
+
+from .animation import FrameSource
+from .frame import HEIGHT, PIXELS, WIDTH, Frame
+
+# Classic 5×7 font for ASCII 0x20-0x7E. Each glyph is five columns, bit 0 is
+# the top row.
+_FONT_5X7 = (
+    b"\x00\x00\x00\x00\x00", b"\x00\x00\x5f\x00\x00", b"\x00\x07\x00\x07\x00",
+    b"\x14\x7f\x14\x7f\x14", b"\x24\x2a\x7f\x2a\x12", b"\x23\x13\x08\x64\x62",
+    b"\x36\x49\x55\x22\x50", b"\x00\x05\x03\x00\x00", b"\x00\x1c\x22\x41\x00",
+    b"\x00\x41\x22\x1c\x00", b"\x08\x2a\x1c\x2a\x08", b"\x08\x08\x3e\x08\x08",
+    b"\x00\x50\x30\x00\x00", b"\x08\x08\x08\x08\x08", b"\x00\x60\x60\x00\x00",
+    b"\x20\x10\x08\x04\x02", b"\x3e\x51\x49\x45\x3e", b"\x00\x42\x7f\x40\x00",
+    b"\x42\x61\x51\x49\x46", b"\x21\x41\x45\x4b\x31", b"\x18\x14\x12\x7f\x10",
+    b"\x27\x45\x45\x45\x39", b"\x3c\x4a\x49\x49\x30", b"\x01\x71\x09\x05\x03",
+    b"\x36\x49\x49\x49\x36", b"\x06\x49\x49\x29\x1e", b"\x00\x36\x36\x00\x00",
+    b"\x00\x56\x36\x00\x00", b"\x08\x14\x22\x41\x00", b"\x14\x14\x14\x14\x14",
+    b"\x00\x41\x22\x14\x08", b"\x02\x01\x51\x09\x06", b"\x32\x49\x79\x41\x3e",
+    b"\x7e\x11\x11\x11\x7e", b"\x7f\x49\x49\x49\x36", b"\x3e\x41\x41\x41\x22",
+    b"\x7f\x41\x41\x22\x1c", b"\x7f\x49\x49\x49\x41", b"\x7f\x09\x09\x09\x01",
+    b"\x3e\x41\x49\x49\x7a", b"\x7f\x08\x08\x08\x7f", b"\x00\x41\x7f\x41\x00",
+    b"\x20\x40\x41\x3f\x01", b"\x7f\x08\x14\x22\x41", b"\x7f\x40\x40\x40\x40",
+    b"\x7f\x02\x0c\x02\x7f", b"\x7f\x04\x08\x10\x7f", b"\x3e\x41\x41\x41\x3e",
+    b"\x7f\x09\x09\x09\x06", b"\x3e\x41\x51\x21\x5e", b"\x7f\x09\x19\x29\x46",
+    b"\x46\x49\x49\x49\x31", b"\x01\x01\x7f\x01\x01", b"\x3f\x40\x40\x40\x3f",
+    b"\x1f\x20\x40\x20\x1f", b"\x3f\x40\x38\x40\x3f", b"\x63\x14\x08\x14\x63",
+    b"\x07\x08\x70\x08\x07", b"\x61\x51\x49\x45\x43", b"\x00\x7f\x41\x41\x00",
+    b"\x02\x04\x08\x10\x20", b"\x00\x41\x41\x7f\x00", b"\x04\x02\x01\x02\x04",
+    b"\x40\x40\x40\x40\x40", b"\x00\x01\x02\x04\x00", b"\x20\x54\x54\x54\x78",
+    b"\x7f\x48\x44\x44\x38", b"\x38\x44\x44\x44\x20", b"\x38\x44\x44\x48\x7f",
+    b"\x38\x54\x54\x54\x18", b"\x08\x7e\x09\x01\x02", b"\x0c\x52\x52\x52\x3e",
+    b"\x7f\x08\x04\x04\x78", b"\x00\x44\x7d\x40\x00", b"\x20\x40\x44\x3d\x00",
+    b"\x7f\x10\x28\x44\x00", b"\x00\x41\x7f\x40\x00", b"\x7c\x04\x18\x04\x78",
+    b"\x7c\x08\x04\x04\x78", b"\x38\x44\x44\x44\x38", b"\x7c\x14\x14\x14\x08",
+    b"\x08\x14\x14\x18\x7c", b"\x7c\x08\x04\x04\x08", b"\x48\x54\x54\x54\x20",
+    b"\x04\x3f\x44\x40\x20", b"\x3c\x40\x40\x20\x7c", b"\x1c\x20\x40\x20\x1c",
+    b"\x3c\x40\x30\x40\x3c", b"\x44\x28\x10\x28\x44", b"\x0c\x50\x50\x50\x3c",
+    b"\x44\x64\x54\x4c\x44", b"\x00\x08\x36\x41\x00", b"\x00\x00\x7f\x00\x00",
+    b"\x00\x41\x36\x08\x00", b"\x08\x04\x08\x10\x08",
+)
+
+# Width of a space, which has no pixels to measure
+_SPACE_WIDTH = 3
+
+FONTS = ("small", "large")
+
+
+def _double_bits(mask: int) -> int:
+    """Stretch a column mask to twice its height."""
+    doubled = 0
+    for bit in range(7):
+        if mask & (1 << bit):
+            doubled |= 0b11 << (2 * bit)
+    return doubled
+
+
+def _build_atlas(font: str) -> dict[str, tuple[int, ...]]:
+    """Build the glyph atlas for a font: character to column masks.
+
+    Empty columns at either side are trimmed, making the font proportional.
+    The small font is the 5×7 font centred vertically; the large font is the
+    same glyphs at double size.
+    """
+    atlas = {}
+    for code, glyph in enumerate(_FONT_5X7, start=0x20):
+        columns = list(glyph)
+        while columns and not columns[0]:
+            columns.pop(0)
+        while columns and not columns[-1]:
+            columns.pop()
+        if not columns:
+            columns = [0] * _SPACE_WIDTH
+        if font == "large":
+            columns = [col for mask in columns for col in (_double_bits(mask) << 1,) * 2]
+        else:
+            columns = [mask << 4 for mask in columns]
+        atlas[chr(code)] = tuple(columns)
+    return atlas
+
+
+_ATLAS = {font: _build_atlas(font) for font in FONTS}
+
+
+def _normalize(text: str) -> str:
+    """Map text onto the characters available in the font."""
+    # Drop accents (Ä -> A) and replace anything else with '?'
+    text = unicodedata.normalize("NFKD", text)
+    return "".join(
+        char if " " <= char <= "~" else "?"
+        for char in text
+        if not unicodedata.combining(char)
+    )
+
+
+def _gap(left: int, right: int) -> int:
+    """Return the kerning gap between two adjacent glyph edge columns.
+
+    Glyphs sit directly next to each other when no pixels of the touching
+    columns would be adjacent, including diagonally (e.g. "T." or "L'"),
+    otherwise one blank column separates them.
+    """
+    if left and right and not (left & (right | right << 1 | right >> 1)):
+        return 0
+    return 1
+
+
+@lru_cache(maxsize=64)
+def render_strip(text: str, font: str = "small") -> tuple[int, ...]:
+    """Render text as a strip of column masks (bit y lit = row y lit)."""
+    atlas = _ATLAS[font]
+    columns: list[int] = []
+    for char in _normalize(text):
+        glyph = atlas[char]
+        if columns:
+            columns.extend((0,) * _gap(columns[-1], glyph[0]))
+        columns.extend(glyph)
+    return tuple(columns)
+
+
+def _window(strip: tuple[int, ...], offset: int) -> Frame:
+    """Return the 16 columns of a strip starting at offset as a frame."""
+    pixels = bytearray(PIXELS)
+    for x in range(WIDTH):
+        column = offset + x
+        if 0 <= column < len(strip) and (mask := strip[column]):
+            for y in range(HEIGHT):
+                if mask & (1 << y):
+                    pixels[y * WIDTH + x] = 1
+    return Frame(pixels)
+
+
+@lru_cache(maxsize=16)
+def render_frames(text: str, font: str = "small") -> tuple[Frame, ...]:
+    """Render text as frames.
+
+    Text that fits the panel becomes a single centred frame; longer text
+    becomes a scroll that enters from the right and leaves on the left.
+    Results are cached, so repeated notifications cost nothing after the
+    first render.
+    """
+    strip = render_strip(text, font)
+    if len(strip) <= WIDTH:
+        return (_window(strip, -((WIDTH - len(strip)) // 2)),)
+    return tuple(_window(strip, offset) for offset in range(-WIDTH, len(strip) + 1))
+
+
+def text_source(text: str, font: str = "small", repeat: int = 1) -> FrameSource:
+    """Return an animation source scrolling text repeat times."""
+    frames = render_frames(text, font)
+    total = len(frames) * repeat
+
+    def source(index: int, elapsed: float) -> Frame | None:
+        if index >= total:
+            return None
+        return frames[index % len(frames)]
+
+    return source
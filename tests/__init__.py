@@ -0,0 +1 @@
+"""Tests for the IKEA OBEGRÄNSAD LED Control integration."""
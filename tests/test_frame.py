@@ -0,0 +1,81 @@
+"""Tests for the frame buffer model."""
+import base64
+import json
+import struct
+import zlib
+
+import pytest
+
+from custom_components.ikea_obegraensad.frame import PACKED_SIZE, PIXELS, Frame
+
+
+def test_frame_requires_256_pixels():
+    with pytest.raises(ValueError):
+        Frame(bytes(PIXELS - 1))
+
+
+def test_frame_is_read_only_and_hashable():
+    frame = Frame(bytearray(PIXELS))
+    with pytest.raises(TypeError):
+        frame.buffer[0] = 1
+    assert frame == Frame(bytes(PIXELS))
+    assert hash(frame) == frame.digest
+
+
+def test_from_packed_unpacks_bits_rows_first():
+    frame = Frame.from_packed(b"\x80" + bytes(PACKED_SIZE - 1))
+    assert frame.buffer[0] == 1
+    assert sum(frame.buffer) == 1
+
+
+def test_parse_accepts_lists_rows_hex_and_base64():
+    flat = [1] + [0] * (PIXELS - 1)
+    rows = [flat[y * 16:(y + 1) * 16] for y in range(16)]
+    packed = b"\x80" + bytes(PACKED_SIZE - 1)
+    expected = Frame(bytes(flat))
+    assert Frame.parse(flat) == expected
+    assert Frame.parse(rows) == expected
+    assert Frame.parse(json.dumps(flat)) == expected
+    assert Frame.parse(packed.hex()) == expected
+    assert Frame.parse(base64.b64encode(packed).decode()) == expected
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        [1.5] * PIXELS,
+        ["a"] * PIXELS,
+        [256] * PIXELS,
+        [-1] * PIXELS,
+        [True] * PIXELS,
+        [[0] * 16, 0],
+        [0] * 10,
+        "[1, 2",
+        "!!not a frame!!",
+        {"data": []},
+    ],
+)
+def test_parse_rejects_invalid_data_with_value_error(value):
+    with pytest.raises(ValueError):
+        Frame.parse(value)
+
+
+def test_diff_lists_changed_pixels():
+    previous = Frame(bytes(PIXELS))
+    current = bytearray(PIXELS)
+    current[5] = current[200] = 7
+    assert Frame(current).diff(previous) == [5, 200]
+    assert previous.diff(previous) == []
+
+
+def test_to_png_encodes_a_scaled_grayscale_image():
+    pixels = bytearray(PIXELS)
+    pixels[0] = 1
+    png = Frame(pixels).to_png(scale=2)
+    assert png.startswith(b"\x89PNG\r\n\x1a\n")
+    width, height, depth, color = struct.unpack(">IIBB", png[16:26])
+    assert (width, height, depth, color) == (32, 32, 8, 0)
+    idat_length = struct.unpack(">I", png[33:37])[0]
+    raw = zlib.decompress(png[41:41 + idat_length])
+    # Filter byte, then on/off pixels stretched to white/black
+    assert raw[:4] == b"\x00\xff\xff\x00"
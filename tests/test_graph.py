@@ -0,0 +1,54 @@
+"""Tests for sensor graph downsampling and scaling."""
+import pytest
+
+from custom_components.ikea_obegraensad import graph
+from custom_components.ikea_obegraensad.graph import downsample, scale_graph
+
+
+@pytest.fixture(params=["numpy", "python"])
+def backend(request, monkeypatch):
+    """Run each test with and without NumPy."""
+    if request.param == "numpy":
+        if graph.np is None:
+            pytest.skip("NumPy is not installed")
+    else:
+        monkeypatch.setattr(graph, "np", None)
+    return request.param
+
+
+def test_downsample_returns_one_value_per_column(backend):
+    times = [float(t) for t in range(160)]
+    values = [float(t % 10) for t in range(160)]
+    result = downsample(times, values, 0.0, 160.0)
+    assert len(result) == 16
+    assert all(0 <= value <= 9 for value in result)
+
+
+def test_downsample_keeps_spikes(backend):
+    times = [float(t) for t in range(160)]
+    values = [0.0] * 160
+    values[85] = 100.0
+    assert 100.0 in downsample(times, values, 0.0, 160.0)
+
+
+def test_downsample_repeats_the_last_value_over_gaps(backend):
+    assert downsample([0.0, 150.0], [1.0, 5.0], 0.0, 160.0) == [1.0] * 15 + [5.0]
+
+
+def test_downsample_of_nothing_is_empty(backend):
+    assert downsample([], [], 0.0, 160.0) == []
+
+
+def test_scale_sends_offsets_from_the_minimum():
+    assert scale_graph([101325.0, 101330.0]) == ([0, 50], 0, 50)
+    assert scale_graph([21.2, 21.9]) == ([0, 70], 0, 70)
+
+
+def test_scale_stays_within_the_firmware_range():
+    values, miny, maxy = scale_graph([0.0, 1e6])
+    assert miny == 0
+    assert all(0 <= value <= maxy <= 32767 for value in values)
+
+
+def test_scale_of_a_flat_line_has_a_range():
+    assert scale_graph([5.0, 5.0]) == ([0, 0], 0, 1)
@@ -0,0 +1,104 @@
+"""Tests for the message mirror."""
+import asyncio
+from types import SimpleNamespace
+
+from custom_components.ikea_obegraensad.const import MESSAGE_AUTO_ID_MIN, MESSAGE_REPEAT_FOREVER
+from custom_components.ikea_obegraensad.messages import MessageManager, _digest
+
+
+class FakeApi:
+    """Record the requests a manager sends."""
+
+    host = "192.168.1.50"
+
+    def __init__(self):
+        self.requests = []
+
+    async def async_request(self, method, path, params=None):
+        self.requests.append((path, dict(params)))
+
+
+def _run(test):
+    """Run test(manager, api) on a fresh event loop."""
+
+    async def main():
+        loop = asyncio.get_running_loop()
+        hass = SimpleNamespace(loop=loop, async_create_task=loop.create_task)
+        api = FakeApi()
+        manager = MessageManager(hass, api)
+        try:
+            await test(manager, api)
+        finally:
+            manager.async_shutdown()
+
+    asyncio.run(main())
+
+
+def test_digest_ignores_the_id():
+    assert _digest({"text": "hi", "id": "1"}) == _digest({"text": "hi", "id": "2"})
+    assert _digest({"text": "hi"}) != _digest({"text": "ho"})
+
+
+def test_auto_ids_start_at_the_reserved_range():
+    async def test(manager, api):
+        first = await manager.async_add("one")
+        second = await manager.async_add("two")
+        assert (first, second) == (MESSAGE_AUTO_ID_MIN, MESSAGE_AUTO_ID_MIN + 1)
+        assert await manager.async_add("three", id=5) == 5
+        assert set(manager.messages) == {5, first, second}
+
+    _run(test)
+
+
+def test_identical_content_reuses_its_id():
+    async def test(manager, api):
+        first = await manager.async_add("again")
+        assert await manager.async_add("again") == first
+        # Finite messages may have finished, so both are uploaded
+        assert len(api.requests) == 2
+        assert api.requests[1][1]["id"] == str(first)
+
+    _run(test)
+
+
+def test_endless_message_on_the_panel_is_not_uploaded_again():
+    async def test(manager, api):
+        await manager.async_add("stay", repeat=MESSAGE_REPEAT_FOREVER)
+        await manager.async_add("stay", repeat=MESSAGE_REPEAT_FOREVER)
+        assert len(api.requests) == 1
+        assert manager.uploads_skipped == 1
+        await manager.async_add("changed", repeat=MESSAGE_REPEAT_FOREVER, id=MESSAGE_AUTO_ID_MIN)
+        assert len(api.requests) == 2
+
+    _run(test)
+
+
+def test_ttl_is_renewed_without_uploading():
+    async def test(manager, api):
+        await manager.async_add("timed", ttl=60)
+        await manager.async_add("timed", ttl=120)
+        assert len(api.requests) == 1
+        assert manager.uploads_skipped == 1
+
+    _run(test)
+
+
+def test_removed_ids_are_allocated_again():
+    async def test(manager, api):
+        first = await manager.async_add("one")
+        await manager.async_remove(first)
+        assert api.requests[-1] == ("removemessage", {"id": str(first)})
+        assert await manager.async_add("two") == first
+
+    _run(test)
+
+
+def test_reconcile_restores_only_persistent_messages():
+    async def test(manager, api):
+        await manager.async_add("once")
+        endless = await manager.async_add("stay", repeat=MESSAGE_REPEAT_FOREVER)
+        api.requests.clear()
+        await manager.async_reconcile()
+        assert [params["id"] for _, params in api.requests] == [str(endless)]
+
+    _run(test)
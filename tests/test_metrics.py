@@ -0,0 +1,56 @@
+"""Tests for the performance counters."""
+from custom_components.ikea_obegraensad.metrics import (
+    LatencyHistogram,
+    PanelMetrics,
+    RateCounter,
+    RequestStats,
+)
+
+
+def test_histogram_summarises_in_milliseconds():
+    histogram = LatencyHistogram()
+    for ms in (1, 2, 3, 4, 100):
+        histogram.record(ms / 1000)
+    summary = histogram.as_dict()
+    assert summary["count"] == 5
+    assert summary["avg_ms"] == 22.0
+    assert summary["max_ms"] == 100.0
+    assert 2 <= summary["p50_ms"] <= 5
+    assert 50 <= summary["p95_ms"] <= 100
+
+
+def test_empty_histogram_has_no_percentiles():
+    assert LatencyHistogram().percentile(0.5) is None
+
+
+def test_slowest_bucket_reports_the_maximum():
+    histogram = LatencyHistogram()
+    histogram.record(30)
+    assert histogram.percentile(0.99) == 30000.0
+
+
+def test_rate_counter_forgets_old_seconds():
+    counter = RateCounter()
+    for second in (0.1, 0.5, 1.2, 59.9):
+        counter.record(second)
+    assert counter.per_minute(59.9) == 4
+    assert counter.per_minute(60.5) == 2
+    assert counter.per_minute(200.0) == 0
+    assert counter.total == 4
+
+
+def test_request_stats_merge_counters_and_latency():
+    stats = RequestStats()
+    stats.errors = 1
+    stats.latency.record(0.01)
+    assert stats.as_dict()["errors"] == 1
+    assert stats.as_dict()["count"] == 1
+
+
+def test_queue_depth_peak_resets_on_read():
+    metrics = PanelMetrics()
+    metrics.record_queue_depth(3)
+    metrics.record_queue_depth(1)
+    assert metrics.take_queue_depth_peak() == 3
+    assert metrics.take_queue_depth_peak() == 0
+    assert metrics.as_dict(0)["queue_depth_max"] == 3
@@ -0,0 +1,47 @@
+"""Tests for the device state snapshots."""
+from types import MappingProxyType
+
+import pytest
+
+from custom_components.ikea_obegraensad.models import DeviceState, PluginIndex, freeze, thaw
+
+
+def test_freeze_and_thaw_round_trip():
+    value = {"plugins": [{"id": 1, "name": "Snake"}], "brightness": 10}
+    frozen = freeze(value)
+    assert isinstance(frozen, MappingProxyType)
+    assert isinstance(frozen["plugins"], tuple)
+    with pytest.raises(TypeError):
+        frozen["plugins"][0]["name"] = "Clock"
+    assert thaw(frozen) == value
+
+
+def test_state_is_immutable():
+    state = DeviceState()
+    with pytest.raises(AttributeError):
+        state.brightness = 5
+    with pytest.raises(AttributeError):
+        del state.brightness
+
+
+def test_evolve_bumps_the_version_and_shares_values():
+    plugins = freeze([{"id": 1, "name": "Snake"}])
+    state = DeviceState(plugins=plugins)
+    evolved = state.evolve(brightness=100)
+    assert (state.version, state.brightness) == (0, 0)
+    assert (evolved.version, evolved.brightness) == (1, 100)
+    assert evolved.plugins is plugins
+
+
+def test_as_dict_is_plain_data():
+    state = DeviceState(schedule=freeze([{"pluginId": 1, "duration": 5}]))
+    assert state.as_dict()["schedule"] == [{"pluginId": 1, "duration": 5}]
+    assert set(state.as_dict()) == set(DeviceState.FIELDS)
+
+
+def test_plugin_index_names_and_options():
+    index = PluginIndex([{"id": 1, "name": "Snake"}, {"id": 2}, "garbage"])
+    assert index.options == ["1: Snake", "2: Unknown"]
+    assert index.ids_by_option["1: Snake"] == 1
+    assert index.name(1) == "Snake"
+    assert index.name(2) == "Plugin 2"
@@ -0,0 +1,81 @@
+"""Tests for the schedule model."""
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from custom_components.ikea_obegraensad.models import PluginIndex
+from custom_components.ikea_obegraensad.schedule import (
+    ScheduleEntry,
+    compile_schedule,
+    device_schedule,
+    next_transition,
+    parse_schedule,
+    schedule_payload,
+)
+
+PLUGINS = PluginIndex([{"id": 3, "name": "Snake"}, {"id": 9, "name": "Clock"}])
+
+
+def test_parse_keeps_names_for_later_resolution():
+    assert parse_schedule('[{"plugin": "Clock", "duration": 60}, {"pluginId": "3", "duration": 30.0}]') == [
+        ("Clock", 60),
+        (3, 30),
+    ]
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "not json",
+        {"pluginId": 1, "duration": 5},
+        ["entry"],
+        [{"duration": 5}],
+        [{"pluginId": 1.9, "duration": 5}],
+        [{"pluginId": 1, "duration": 1.5}],
+        [{"pluginId": 1, "duration": 0}],
+        [{"pluginId": 1, "duration": 86401}],
+        [{"pluginId": True, "duration": 5}],
+    ],
+)
+def test_parse_rejects_invalid_schedules(value):
+    with pytest.raises(ValueError):
+        parse_schedule(value)
+
+
+def test_compile_resolves_names_case_insensitively():
+    assert compile_schedule([{"plugin": "clock", "duration": 60}, {"pluginId": 3, "duration": 5}], PLUGINS) == (
+        ScheduleEntry(9, 60),
+        ScheduleEntry(3, 5),
+    )
+
+
+def test_compile_rejects_unknown_plugins():
+    with pytest.raises(ValueError, match="unknown plugin"):
+        compile_schedule([{"plugin": "Tetris", "duration": 5}], PLUGINS)
+    with pytest.raises(ValueError, match="unknown plugin"):
+        compile_schedule([{"pluginId": 4, "duration": 5}], PLUGINS)
+
+
+def test_compile_without_catalogue_accepts_any_id():
+    assert compile_schedule([{"pluginId": 42, "duration": 5}]) == (ScheduleEntry(42, 5),)
+
+
+def test_device_schedule_returns_none_when_unreadable():
+    assert device_schedule([{"pluginId": 3, "duration": 5}]) == (ScheduleEntry(3, 5),)
+    assert device_schedule("garbage") is None
+
+
+def test_payload_is_compact_json():
+    assert schedule_payload((ScheduleEntry(3, 5), ScheduleEntry(9, 60))) == (
+        '[{"pluginId":3,"duration":5},{"pluginId":9,"duration":60}]'
+    )
+
+
+def test_next_transition_follows_the_active_plugin():
+    since = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    entries = (ScheduleEntry(3, 5), ScheduleEntry(9, 60))
+    assert next_transition(entries, 3, since) == (ScheduleEntry(9, 60), since + timedelta(seconds=5))
+    assert next_transition(entries, 9, since) == (ScheduleEntry(3, 5), since + timedelta(seconds=60))
+    assert next_transition(entries, 7, since) is None
+    assert next_transition((), 3, since) is None
+    assert next_transition(entries, 3, None) is None
@@ -0,0 +1,59 @@
+"""Tests for the snapshot ring."""
+from datetime import datetime, timedelta, timezone
+import os
+
+from custom_components.ikea_obegraensad.snapshots import SnapshotStore
+
+NOW = datetime(2024, 1, 1, 12, tzinfo=timezone.utc)
+
+
+def _store(directory, **limits):
+    options = {"per_host": 3, "max_age": timedelta(days=1), "max_bytes": 10_000}
+    options.update(limits)
+    return SnapshotStore(None, str(directory), **options)
+
+
+def _write(directory, name, age, size=1):
+    """Write a file last modified age seconds before NOW."""
+    path = directory / name
+    path.write_bytes(b"\x00" * size)
+    stamp = NOW.timestamp() - age
+    os.utime(path, (stamp, stamp))
+
+
+def _names(directory):
+    return sorted(os.listdir(directory))
+
+
+def test_save_names_files_by_sanitised_host(tmp_path):
+    paths = _store(tmp_path)._save({"10.0.0.1:8080": b"\x00" * 256}, NOW)
+    assert [os.path.basename(path) for path in paths] == ["10.0.0.1_8080_20240101T120000000000Z.bin"]
+    assert os.path.getsize(paths[0]) == 256
+
+
+def test_keeps_the_newest_snapshots_per_host(tmp_path):
+    for age in range(1, 6):
+        _write(tmp_path, f"a_{age}.bin", age)
+    _write(tmp_path, "b_1.bin", 10)
+    _store(tmp_path)._evict(NOW.timestamp())
+    assert _names(tmp_path) == ["a_1.bin", "a_2.bin", "a_3.bin", "b_1.bin"]
+
+
+def test_evicts_snapshots_older_than_max_age(tmp_path):
+    _write(tmp_path, "a_old.bin", 2 * 86400)
+    _write(tmp_path, "a_new.bin", 60)
+    _store(tmp_path)._evict(NOW.timestamp())
+    assert _names(tmp_path) == ["a_new.bin"]
+
+
+def test_evicts_oldest_files_over_the_size_limit(tmp_path):
+    for age in range(1, 4):
+        _write(tmp_path, f"h{age}_1.bin", age, size=256)
+    _store(tmp_path, max_bytes=600)._evict(NOW.timestamp())
+    assert _names(tmp_path) == ["h1_1.bin", "h2_1.bin"]
+
+
+def test_ignores_other_files(tmp_path):
+    _write(tmp_path, "notes.txt", 10 * 86400)
+    _store(tmp_path)._evict(NOW.timestamp())
+    assert _names(tmp_path) == ["notes.txt"]
@@ -0,0 +1,47 @@
+"""Tests for local text rendering."""
+from custom_components.ikea_obegraensad.frame import WIDTH
+from custom_components.ikea_obegraensad.text import render_frames, render_strip, text_source
+
+
+def test_short_text_is_a_single_centred_frame():
+    strip = render_strip("Hi")
+    frames = render_frames("Hi")
+    assert len(frames) == 1
+    lit_columns = [x for x in range(WIDTH) if any(frames[0].buffer[y * WIDTH + x] for y in range(16))]
+    left = lit_columns[0]
+    right = WIDTH - 1 - lit_columns[-1]
+    assert abs(left - right) <= 1
+    assert len(strip) <= WIDTH
+
+
+def test_kerning_joins_glyphs_that_do_not_touch():
+    # "T." fits together, "HH" needs a blank column
+    assert len(render_strip("T.")) < len(render_strip("T")) + 1 + len(render_strip("."))
+    assert len(render_strip("HH")) == 2 * len(render_strip("H")) + 1
+
+
+def test_large_font_is_twice_the_size():
+    small = render_strip("I")
+    large = render_strip("I", "large")
+    assert len(large) == 2 * len(small)
+    assert bin(max(large)).count("1") == 2 * bin(max(small)).count("1")
+
+
+def test_long_text_scrolls_in_and_out():
+    strip = render_strip("Hello world")
+    frames = render_frames("Hello world")
+    assert len(frames) == len(strip) + WIDTH + 1
+    assert not any(frames[0].buffer)
+    assert not any(frames[-1].buffer)
+
+
+def test_renders_are_cached():
+    assert render_frames("cached") is render_frames("cached")
+
+
+def test_text_source_repeats_then_ends():
+    frames = render_frames("Hello world")
+    source = text_source("Hello world", repeat=2)
+    assert source(0, 0) == frames[0]
+    assert source(len(frames), 0) == frames[0]
+    assert source(2 * len(frames), 0) is None
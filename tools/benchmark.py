@@ -0,0 +1,210 @@
+"""End-to-end benchmark of the integration against simulated panels.
+
+Starts fake panels (see simulator.py) and real IkeaLedCoordinator instances
+on a Home Assistant core instance, then measures for each panel count:
+
+- startup: seconds until every panel is connected and has sent its state
+- rtt_ms: brightness command round-trip latency (p50/p95/max)
+- throughput: WebSocket state updates processed per second
+- memory_per_panel_kb and threads: Python allocations per panel (tracemalloc)
+  and the thread count after startup
+
+Needs the packages from requirements.txt (Home Assistant core) plus aiohttp.
+The simulated panels run in the same process, so their share of CPU and
+memory is included in the numbers. Results are printed as JSON:
+
+    python tools/benchmark.py --panels 1,10,50,100,200 --output bench.json
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections.abc import Callable
+import json
+import logging
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from typing import Any
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from simulator import start_panels  # noqa: E402
+
+_LOGGER = logging.getLogger("benchmark")
+
+
+async def _create_hass(config_dir: str) -> Any:
+    """Create a bare Home Assistant core instance on the running loop."""
+    from homeassistant.core import HomeAssistant
+    from homeassistant.helpers import frame
+
+    try:
+        hass = HomeAssistant(config_dir)
+    except TypeError:  # Before 2024.2 the config dir was set afterwards
+        hass = HomeAssistant()
+        hass.config.config_dir = config_dir
+    if hasattr(frame, "async_setup"):
+        frame.async_setup(hass)
+    return hass
+
+
+async def _wait_until(condition: Callable[[], bool], timeout: float) -> bool:
+    """Poll condition every 10 ms until it holds or the timeout passes."""
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            return False
+        await asyncio.sleep(0.01)
+    return True
+
+
+def _summary_ms(samples: list[float]) -> dict[str, Any]:
+    """Return p50/p95/max of durations in seconds, in milliseconds."""
+    if not samples:
+        return {"count": 0, "p50": None, "p95": None, "max": None}
+    ordered = sorted(samples)
+    p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+    return {
+        "count": len(samples),
+        "p50": round(statistics.median(ordered) * 1000, 2),
+        "p95": round(p95 * 1000, 2),
+        "max": round(ordered[-1] * 1000, 2),
+    }
+
+
+async def run_scenario(count: int, args: argparse.Namespace) -> dict[str, Any]:
+    """Benchmark count panels."""
+    from custom_components.ikea_obegraensad.coordinator import IkeaLedCoordinator
+    from custom_components.ikea_obegraensad.supervisor import IkeaLedSupervisor
+
+    panels, addresses, runners = await start_panels(
+        count, port=args.port, latency=args.latency, jitter=args.jitter
+    )
+    result: dict[str, Any] = {"panels": count}
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = await _create_hass(config_dir)
+        supervisor = IkeaLedSupervisor(hass)
+        coordinators = []
+        tracemalloc.start()
+        memory_before = tracemalloc.get_traced_memory()[0]
+        threads_before = threading.active_count()
+        try:
+            start = time.monotonic()
+            for index, address in enumerate(addresses):
+                coordinator = IkeaLedCoordinator(
+                    hass, address, max_command_rate=1000, supervisor=supervisor
+                )
+                supervisor.async_add(str(index), coordinator)
+                coordinators.append(coordinator)
+            connected = await _wait_until(
+                lambda: all(c.ws_connected and c.get_available_plugins() for c in coordinators),
+                args.timeout,
+            )
+            result["startup_s"] = round(time.monotonic() - start, 3) if connected else None
+            result["memory_per_panel_kb"] = round(
+                (tracemalloc.get_traced_memory()[0] - memory_before) / count / 1024, 1
+            )
+            tracemalloc.stop()
+            result["threads"] = threading.active_count()
+            result["threads_added"] = threading.active_count() - threads_before
+            if not connected:
+                result["error"] = "panels did not connect in time"
+                return result
+
+            rtts: list[float] = []
+            timeouts = 0
+
+            async def _drive(coordinator: IkeaLedCoordinator) -> None:
+                nonlocal timeouts
+                for _ in range(args.commands):
+                    brightness = (coordinator.get_brightness() + 1) % 256
+                    ack = await coordinator.async_set_brightness(brightness)
+                    if (rtt := await coordinator.async_wait_for_ack(ack)) is None:
+                        timeouts += 1
+                    else:
+                        rtts.append(rtt)
+
+            await asyncio.gather(*(_drive(c) for c in coordinators))
+            result["rtt_ms"] = _summary_ms(rtts)
+            result["ack_timeouts"] = timeouts
+
+            def _received() -> int:
+                return sum(c.metrics.ws_received.total for c in coordinators)
+
+            expected = _received() + count * args.flood
+            start = time.monotonic()
+            await asyncio.gather(*(panel.flood(args.flood) for panel in panels))
+            await _wait_until(lambda: _received() >= expected, args.timeout)
+            elapsed = time.monotonic() - start
+            result["throughput_msgs_per_s"] = round(count * args.flood / elapsed, 1)
+            return result
+        finally:
+            if tracemalloc.is_tracing():
+                tracemalloc.stop()
+            for index, coordinator in enumerate(coordinators):
+                await supervisor.async_remove(str(index))
+                await coordinator.async_shutdown()
+            for runner in runners:
+                await runner.cleanup()
+            try:
+                await hass.async_stop(force=True)
+            except Exception as ex:  # pylint: disable=broad-except
+                _LOGGER.debug("Stopping Home Assistant failed: %s", ex)
+
+
+async def _main(args: argparse.Namespace) -> dict[str, Any]:
+    results = []
+    for count in args.panels:
+        _LOGGER.info("Benchmarking %s panels", count)
+        results.append(await run_scenario(count, args))
+    return {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "latency": args.latency,
+            "jitter": args.jitter,
+            "commands": args.commands,
+            "flood": args.flood,
+        },
+        "results": results,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--panels",
+        type=lambda value: [int(part) for part in value.split(",")],
+        default=[1, 10, 50, 100, 200],
+        help="comma-separated panel counts (default 1,10,50,100,200)",
+    )
+    parser.add_argument("--port", type=int, default=18081, help="port of the first panel")
+    parser.add_argument("--latency", type=float, default=0.005, help="simulated delay in seconds")
+    parser.add_argument("--jitter", type=float, default=0.002, help="random +/- delay in seconds")
+    parser.add_argument("--commands", type=int, default=20, help="commands per panel for RTT")
+    parser.add_argument("--flood", type=int, default=200, help="updates per panel for throughput")
+    parser.add_argument("--timeout", type=float, default=120, help="seconds to wait per phase")
+    parser.add_argument("--output", help="write JSON results to this file instead of stdout")
+    parser.add_argument("-v", "--verbose", action="store_true", help="debug logging")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.DEBUG if args.verbose else logging.INFO)
+
+    report = asyncio.run(_main(args))
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            file.write(text + "\n")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
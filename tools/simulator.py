@@ -0,0 +1,276 @@
+"""Fake IKEA OBEGRÄNSAD firmware for local testing and benchmarks.
+
+Serves the WebSocket and REST endpoints the integration uses, with
+configurable latency, jitter, HTTP errors and random disconnects. Run it on
+its own and add ``127.0.0.1:<port>`` as a device in Home Assistant:
+
+    python tools/simulator.py --panels 3 --port 8081 --latency 0.02
+
+or import FakePanel / start_panels from another script (see benchmark.py).
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import random
+from typing import Any
+
+from aiohttp import WSMsgType, web
+
+_LOGGER = logging.getLogger("simulator")
+
+PIXELS = 256
+PLUGINS = [
+    {"id": 1, "name": "Draw"},
+    {"id": 2, "name": "Breakout"},
+    {"id": 3, "name": "Snake"},
+    {"id": 4, "name": "Game of Life"},
+    {"id": 5, "name": "Stars"},
+    {"id": 6, "name": "Lines"},
+    {"id": 7, "name": "Circle"},
+    {"id": 8, "name": "Rain"},
+    {"id": 9, "name": "Clock"},
+]
+
+
+class FakePanel:
+    """One simulated panel with its own state and aiohttp application."""
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        disconnect_every: float | None = None,
+        error_rate: float = 0.0,
+        seed: int | None = None,
+    ) -> None:
+        """Initialize the panel.
+
+        latency and jitter (seconds) delay every response; disconnect_every is
+        the mean time in seconds between dropped WebSocket connections and
+        error_rate the share of HTTP requests answered with HTTP 500.
+        """
+        self.latency = latency
+        self.jitter = jitter
+        self.disconnect_every = disconnect_every
+        self.error_rate = error_rate
+        self._rng = random.Random(seed)
+        self.state: dict[str, Any] = {
+            "brightness": 128,
+            "rotation": 0,
+            "plugin": 1,
+            "persist-plugin": 1,
+            "scheduleActive": False,
+            "schedule": [],
+            "plugins": PLUGINS,
+        }
+        self.messages: dict[int, dict[str, str]] = {}
+        self.buffer = bytearray(PIXELS)
+        self.clients: set[web.WebSocketResponse] = set()
+        self.requests = 0
+
+        self.app = web.Application()
+        self.app.router.add_get("/ws", self._handle_ws)
+        self.app.router.add_get("/api/info", self._handle_info)
+        self.app.router.add_get("/api/data", self._handle_data)
+        self.app.router.add_get("/api/message", self._handle_message)
+        self.app.router.add_get("/api/removemessage", self._handle_remove_message)
+        self.app.router.add_post("/api/schedule", self._handle_schedule)
+        self.app.router.add_get("/api/schedule/clear", self._handle_schedule_clear)
+        self.app.router.add_get("/api/schedule/start", self._handle_schedule_start)
+        self.app.router.add_get("/api/schedule/stop", self._handle_schedule_stop)
+        self.app.router.add_get("/api/storage/clear", self._handle_storage_clear)
+
+    async def _delay(self) -> None:
+        """Wait the configured latency plus jitter."""
+        delay = self.latency + self._rng.uniform(-self.jitter, self.jitter)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    async def broadcast(self, data: dict[str, Any]) -> None:
+        """Send a state update to every connected client."""
+        message = json.dumps(data)
+        for ws in list(self.clients):
+            if not ws.closed:
+                await ws.send_str(message)
+
+    async def flood(self, count: int) -> None:
+        """Send count state updates as fast as possible (for throughput tests)."""
+        for index in range(count):
+            self.state["brightness"] = index % 256
+            await self.broadcast({"brightness": self.state["brightness"]})
+
+    async def _handle_ws(self, request: web.Request) -> web.WebSocketResponse:
+        ws = web.WebSocketResponse(autoping=True)
+        await ws.prepare(request)
+        self.clients.add(ws)
+        dropper = None
+        if self.disconnect_every:
+            dropper = asyncio.create_task(self._drop_later(ws))
+        try:
+            await self._delay()
+            await ws.send_str(json.dumps(self.state))
+            async for msg in ws:
+                if msg.type != WSMsgType.TEXT:
+                    continue
+                await self._handle_event(json.loads(msg.data))
+        finally:
+            self.clients.discard(ws)
+            if dropper is not None:
+                dropper.cancel()
+        return ws
+
+    async def _drop_later(self, ws: web.WebSocketResponse) -> None:
+        """Close the connection after a random, exponentially distributed time."""
+        await asyncio.sleep(self._rng.expovariate(1 / self.disconnect_every))
+        _LOGGER.debug("Dropping WebSocket connection")
+        await ws.close()
+
+    async def _handle_event(self, data: dict[str, Any]) -> None:
+        """Apply a WebSocket command and echo the changed field."""
+        await self._delay()
+        event = data.get("event")
+        if event == "brightness":
+            self.state["brightness"] = int(data["brightness"])
+            await self.broadcast({"brightness": self.state["brightness"]})
+        elif event == "plugin":
+            self.state["plugin"] = int(data["plugin"])
+            await self.broadcast({"plugin": self.state["plugin"]})
+        elif event == "rotate":
+            step = 1 if data.get("direction") == "right" else -1
+            self.state["rotation"] = (self.state["rotation"] + step) % 4
+            await self.broadcast({"rotation": self.state["rotation"]})
+        elif event == "persist-plugin":
+            self.state["persist-plugin"] = self.state["plugin"]
+            await self.broadcast({"persist-plugin": self.state["persist-plugin"]})
+        elif event == "screen":
+            self.buffer[:] = bytes(data["data"])
+        else:
+            _LOGGER.debug("Ignoring unknown event %s", event)
+
+    async def _http(self) -> web.Response | None:
+        """Count and delay an HTTP request; return an error response if one is due."""
+        self.requests += 1
+        await self._delay()
+        if self.error_rate and self._rng.random() < self.error_rate:
+            return web.Response(status=500)
+        return None
+
+    async def _handle_info(self, request: web.Request) -> web.Response:
+        return await self._http() or web.json_response(self.state)
+
+    async def _handle_data(self, request: web.Request) -> web.Response:
+        return await self._http() or web.Response(body=bytes(self.buffer))
+
+    async def _handle_message(self, request: web.Request) -> web.Response:
+        if error := await self._http():
+            return error
+        params = dict(request.query)
+        self.messages[int(params.get("id", 0))] = params
+        return web.Response(text="OK")
+
+    async def _handle_remove_message(self, request: web.Request) -> web.Response:
+        if error := await self._http():
+            return error
+        self.messages.pop(int(request.query.get("id", 0)), None)
+        return web.Response(text="OK")
+
+    async def _handle_schedule(self, request: web.Request) -> web.Response:
+        if error := await self._http():
+            return error
+        form = await request.post()
+        try:
+            self.state["schedule"] = json.loads(form["schedule"])
+        except (KeyError, ValueError):
+            return web.Response(status=400)
+        await self.broadcast({"schedule": self.state["schedule"]})
+        return web.Response(text="OK")
+
+    async def _handle_schedule_clear(self, request: web.Request) -> web.Response:
+        if error := await self._http():
+            return error
+        self.state["schedule"] = []
+        self.state["scheduleActive"] = False
+        await self.broadcast({"schedule": [], "scheduleActive": False})
+        return web.Response(text="OK")
+
+    async def _handle_schedule_start(self, request: web.Request) -> web.Response:
+        if error := await self._http():
+            return error
+        self.state["scheduleActive"] = bool(self.state["schedule"])
+        await self.broadcast({"scheduleActive": self.state["scheduleActive"]})
+        return web.Response(text="OK")
+
+    async def _handle_schedule_stop(self, request: web.Request) -> web.Response:
+        if error := await self._http():
+            return error
+        self.state["scheduleActive"] = False
+        await self.broadcast({"scheduleActive": False})
+        return web.Response(text="OK")
+
+    async def _handle_storage_clear(self, request: web.Request) -> web.Response:
+        return await self._http() or web.Response(text="OK")
+
+
+async def start_panels(
+    count: int, host: str = "127.0.0.1", port: int = 8081, **options: Any
+) -> tuple[list[FakePanel], list[str], list[web.AppRunner]]:
+    """Start count panels on consecutive ports.
+
+    Returns the panels, their "host:port" addresses and the runners to clean up.
+    """
+    panels, addresses, runners = [], [], []
+    for index in range(count):
+        panel = FakePanel(**options)
+        runner = web.AppRunner(panel.app, access_log=None)
+        await runner.setup()
+        await web.TCPSite(runner, host, port + index).start()
+        panels.append(panel)
+        addresses.append(f"{host}:{port + index}")
+        runners.append(runner)
+    return panels, addresses, runners
+
+
+async def _main(args: argparse.Namespace) -> None:
+    _, addresses, runners = await start_panels(
+        args.panels,
+        args.host,
+        args.port,
+        latency=args.latency,
+        jitter=args.jitter,
+        disconnect_every=args.disconnect_every,
+        error_rate=args.error_rate,
+    )
+    print("Simulated panels:", ", ".join(addresses))
+    try:
+        await asyncio.Event().wait()
+    finally:
+        for runner in runners:
+            await runner.cleanup()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--panels", type=int, default=1, help="number of panels")
+    parser.add_argument("--host", default="127.0.0.1", help="address to listen on")
+    parser.add_argument("--port", type=int, default=8081, help="port of the first panel")
+    parser.add_argument("--latency", type=float, default=0.0, help="response delay in seconds")
+    parser.add_argument("--jitter", type=float, default=0.0, help="random +/- delay in seconds")
+    parser.add_argument(
+        "--disconnect-every", type=float, default=None,
+        help="mean seconds between dropped WebSocket connections",
+    )
+    parser.add_argument("--error-rate", type=float, default=0.0, help="share of HTTP 500 responses")
+    parser.add_argument("-v", "--verbose", action="store_true", help="debug logging")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.DEBUG if args.verbose else logging.INFO)
+    try:
+        asyncio.run(_main(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()